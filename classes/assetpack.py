@@ -0,0 +1,245 @@
+"""Pre-decoded asset pack — images stored in display pixel format, memory-mapped at runtime.
+
+File layout::
+
+    MAGIC (8 bytes) | index length (uint32 LE) | JSON index | padding | pixel blobs
+
+The JSON index maps every entry name to its blob offset, pixel size and byte
+format, and records a content hash, size and modification time for each
+source file the pack was built from.  A source whose size and mtime still
+match is taken as unchanged without being read; only the others are
+re-hashed, so a fresh pack opens without touching the loose files.  At runtime the pack is memory-mapped and surfaces are built straight
+from the mapped bytes, so no PNG/JPG decoding happens.  Entries whose source
+files changed since the build are reported stale and the caller falls back
+to the loose files.
+
+Build (or rebuild) the pack with::
+
+    python -m classes.assetpack
+"""
+import hashlib
+import json
+import mmap
+import os
+import struct
+
+import pygame
+
+from . import atlas
+
+PACK_PATH = 'images/assets.pack'
+MAGIC = b'CHPACK01'
+_HEADER = struct.Struct('<8sI')
+_ALIGN = 64
+
+
+def file_hash(path):
+    """Return the SHA-1 hex digest of a file's contents."""
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def file_stamp(path):
+    """``[size, mtime_ns]`` of a file, as stored in the pack index."""
+    st = os.stat(path)
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _pixel_format(surface):
+    """Byte order matching *surface*'s in-memory layout (32-bit surfaces)."""
+    if surface.get_bitsize() == 32 and surface.get_masks()[0] == 0x00ff0000:
+        return 'BGRA'
+    return 'RGBA'
+
+
+def _display_alpha_masks():
+    return pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha().get_masks()
+
+
+def _align(n):
+    return (n + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+# ---------------------------------------------------------------------------
+#  Runtime reader
+# ---------------------------------------------------------------------------
+
+class AssetPack:
+    """Read-only view of a memory-mapped asset pack."""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, index_len = _HEADER.unpack_from(self._map, 0)
+            if magic != MAGIC:
+                raise ValueError(f"{path}: not an asset pack")
+            start = _HEADER.size
+            index = json.loads(self._map[start:start + index_len])
+        except Exception:
+            self.close()
+            raise
+        self._entries = index['entries']
+        self._sources = index['sources']
+        self._atlas = index.get('atlas')
+        self._base = _align(start + index_len)
+        self._view = memoryview(self._map)
+        self._fresh = {}   # source path -> unchanged since the build?
+
+    def _source_fresh(self, path):
+        fresh = self._fresh.get(path)
+        if fresh is None:
+            fresh = self._fresh[path] = self._check_source(path)
+        return fresh
+
+    def _check_source(self, path):
+        stored = self._sources.get(path)
+        if stored is None:
+            return False
+        if isinstance(stored, str):   # packs written before size/mtime were recorded
+            stored = {'sha1': stored}
+        try:
+            if stored.get('stamp') == file_stamp(path):
+                return True
+            return file_hash(path) == stored['sha1']
+        except OSError:
+            return False
+
+    def is_fresh(self, sources):
+        """True if every source file is unchanged since the pack was built.
+
+        Files whose size and mtime match the index are not read; the rest
+        are compared by content hash.
+        """
+        return all(self._source_fresh(path) for path in sources)
+
+    def surface(self, name, opaque=False, alpha_masks=None):
+        """Build a surface for entry *name* from the mapped bytes (no decoding).
+
+        Alpha surfaces already in display format reference the mapping
+        directly; anything else gets a plain format copy.
+        """
+        entry = self._entries[name]
+        offset = self._base + entry['offset']
+        w, h = entry['size']
+        data = self._view[offset:offset + w * h * 4]
+        surf = pygame.image.frombuffer(data, (w, h), entry['format'])
+        if opaque:
+            return surf.convert()
+        if surf.get_masks() != (alpha_masks or _display_alpha_masks()):
+            return surf.convert_alpha()
+        return surf
+
+    def has(self, names):
+        """True if the pack contains every entry in *names*."""
+        return all(name in self._entries for name in names)
+
+    def get(self, names, sources, opaque=False):
+        """Return surfaces for *names*, or None if missing or stale."""
+        if not self.has(names):
+            return None
+        if not self.is_fresh(sources):
+            return None
+        masks = _display_alpha_masks()
+        return [self.surface(name, opaque, masks) for name in names]
+
+    def atlas(self, names, sources):
+        """Return the stored texture atlas if it covers *names* and is fresh."""
+        layout = self._atlas
+        if layout is None or not all(name in layout['sprites'] for name in names):
+            return None
+        if not self.is_fresh(sources):
+            return None
+        masks = _display_alpha_masks()
+        pages = [self.surface(f'atlas/page/{i}', False, masks)
+                 for i in range(len(layout['pages']))]
+        return atlas.Atlas.from_layout(pages, layout)
+
+    def close(self):
+        # surfaces built by frombuffer keep the mapping alive; leave it to GC
+        self._file.close()
+
+
+def open_pack(path=PACK_PATH):
+    """Open the asset pack at *path*; return None if it is missing or unreadable."""
+    if not os.path.exists(path):
+        return None
+    try:
+        return AssetPack(path)
+    except (OSError, ValueError, KeyError, struct.error):
+        print(f"Warning: ignoring unreadable asset pack {path}")
+        return None
+
+
+# ---------------------------------------------------------------------------
+#  Build step
+# ---------------------------------------------------------------------------
+
+def write_pack(path, entries, sources, sprite_atlas=None):
+    """Write *entries* — an iterable of (name, surface) — to a pack at *path*.
+
+    Surfaces should already be in display format; their pixels are stored
+    as-is.  *sources* is the list of source files to hash (and stamp) into
+    the index.
+    An optional *sprite_atlas* is stored as page entries plus its layout.
+    """
+    index = {'entries': {},
+             'sources': {p: {'sha1': file_hash(p), 'stamp': file_stamp(p)} for p in sources}}
+    if sprite_atlas is not None:
+        index['atlas'] = sprite_atlas.to_layout()
+        entries = list(entries) + [(f'atlas/page/{i}', page)
+                                   for i, page in enumerate(sprite_atlas.pages)]
+    blobs = []
+    offset = 0
+    for name, surface in entries:
+        fmt = _pixel_format(surface)
+        data = pygame.image.tobytes(surface, fmt)
+        index['entries'][name] = {
+            'offset': offset,
+            'size': list(surface.get_size()),
+            'format': fmt,
+        }
+        blobs.append(data)
+        pad = _align(len(data)) - len(data)
+        blobs.append(b'\0' * pad)
+        offset += len(data) + pad
+
+    index_bytes = json.dumps(index, separators=(',', ':')).encode()
+    header = _HEADER.pack(MAGIC, len(index_bytes)) + index_bytes
+    header += b'\0' * (_align(len(header)) - len(header))
+
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(header)
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp, path)
+    return offset
+
+
+def build(path=PACK_PATH):
+    """Decode every image in the asset manifest and write the pack."""
+    from .assets import IMAGE_STEPS, atlas_specs, load_loose  # deferred: assets imports this module
+
+    pygame.display.init()
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+
+    entries = []
+    sources = []
+    for _, specs in IMAGE_STEPS:
+        for spec in specs:
+            entries.extend(zip(spec.names, load_loose(spec)))
+            sources.extend(spec.paths)
+
+    images = dict(entries)
+    sprite_atlas = atlas.build([(name, images[name], spec.rle)
+                                for spec in atlas_specs() for name in spec.names])
+
+    size = write_pack(path, entries, sources, sprite_atlas)
+    print(f"Wrote {path}: {len(entries)} surfaces + {len(sprite_atlas.pages)} atlas pages, "
+          f"{size // 1024} KiB of pixels")
+
+
+if __name__ == '__main__':
+    build()
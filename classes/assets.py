@@ -1,23 +1,393 @@
 """Asset loading and management — all images and sounds loaded once at startup."""
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
 import pygame
 
-from .constants import WIDTH, HEIGHT
+from .constants import WIDTH, HEIGHT, ASSET_MEMORY_BUDGET
 from . import sound
+from . import assetpack
+from . import atlas
+from . import fonts
+from . import masks
+from . import profiler
+from . import rotation
+from . import viewport
+from . import surfaces
+
+
+# ---------------------------------------------------------------------------
+#  Image manifest — every image the game loads, grouped by loading step
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class ImageSpec:
+    """One manifest entry: where an image comes from and where it is stored.
+
+    ``attr``/``key`` name the GameAssets slot (``key`` None stores on the
+    attribute itself).  ``mode`` is 'opaque' (convert) or 'alpha'
+    (convert_alpha); ``rle`` allows RLE acceleration and should be off for
+    images that get rotated or otherwise transformed.  ``many`` stores a list.
+
+    ``tier``/``until`` give the score range in which the entry is needed;
+    entries outside it are loaded on demand and may be evicted.
+    """
+    attr: str
+    key: Optional[str]
+    paths: Tuple[str, ...]
+    mode: str = 'alpha'
+    size: Optional[Tuple[int, int]] = None
+    many: bool = False
+    rle: bool = True
+    tier: int = 0
+    until: Optional[int] = None
+
+    @property
+    def tiered(self):
+        return self.tier > 0 or self.until is not None
+
+    @property
+    def names(self):
+        """Pack entry names, one per source path."""
+        base = self.attr if self.key is None else f"{self.attr}/{self.key}"
+        if not self.many:
+            return [base]
+        return [f"{base}/{i}" for i in range(len(self.paths))]
+
+
+def _one(attr, key, path, mode='alpha', size=None, tier=0, until=None, rle=True):
+    return ImageSpec(attr, key, (path,), mode, size, rle=rle, tier=tier, until=until)
+
+
+def _many(attr, key, paths, mode='alpha', rle=True):
+    return ImageSpec(attr, key, tuple(paths), mode, many=True, rle=rle)
+
+
+# Loaded first and blocking — everything the main menu draws.
+MENU_STEPS = [
+    ("Loading menu...", [
+        _one('menu', 'background', 'images/mainmenu.jpg', 'opaque', (WIDTH, HEIGHT)),
+        _one('menu', 'logo', 'images/ch.png'),
+    ]),
+]
+
+# Streamed in the background while the menu runs.
+GAME_STEPS = [
+    ("Loading backgrounds...", [
+        _one('backgrounds', 'bg1', 'images/bg/background.jpg', 'opaque', until=3000),
+        _one('backgrounds', 'bg2', 'images/bg/background2.png', 'opaque',
+             tier=3000, until=10000),
+        _one('backgrounds', 'bg3', 'images/bg/background3.png', 'opaque',
+             tier=10000, until=15000),
+        _one('backgrounds', 'bg4', 'images/bg/background4.png', 'opaque', tier=15000),
+    ]),
+    ("Loading player...", [
+        _one('player', 'ship', 'images/player.png'),
+        _one('bullets', 'player', 'images/bullets/bullet1.png'),
+        _one('bullets', 'enemy2', 'images/bullets/bullet4.png'),
+        _one('bullets', 'boss1', 'images/bullets/bulletboss1.png'),
+        _one('bullets', 'boss2', 'images/bullets/bulletboss2.png', rle=False),
+        _one('bullets', 'boss3', 'images/bullets/bulletboss3.png', rle=False),
+    ]),
+    ("Loading explosions...", [
+        _many('explosions', 'explosion1',
+              [f"images/explosion/explosion{i}.png" for i in range(8)]),
+        _many('explosions', 'explosion2',
+              [f"images/explosion2/explosion{i}.png" for i in range(18)]),
+        _many('explosions', 'explosion3',
+              [f"images/explosion3/explosion{i}.png" for i in range(18)]),
+    ]),
+    ("Loading enemies...", [
+        _many('enemies', 'enemy1', [
+            'images/enemy/enemy1_1.png',
+            'images/enemy/enemy1_2.png',
+            'images/enemy/enemy1_3.png',
+        ]),
+        _many('enemies', 'enemy2', [
+            'images/enemy/enemy2_1.png',
+            'images/enemy/enemy2_2.png',
+        ]),
+    ]),
+    ("Loading bosses...", [
+        _one('bosses', 'boss1', 'images/boss/boss1.png', tier=5000, until=10000),
+        _one('bosses', 'boss2', 'images/boss/boss2_1.png', tier=10000, until=15000),
+        _one('bosses', 'boss3', 'images/boss/boss3.png', tier=15000),
+    ]),
+    ("Loading powerups...", [
+        _one('refills', 'health', 'images/refill/health_refill.png'),
+        _one('refills', 'bullet', 'images/refill/bullet_refill.png'),
+        _one('refills', 'double', 'images/refill/double_refill.png'),
+        _one('refills', 'extra_score', 'images/score/score_coin.png'),
+    ]),
+    ("Loading meteors...", [
+        _many('meteors', 'meteor1', [
+            'images/meteors/meteor_1.png',
+            'images/meteors/meteor_2.png',
+            'images/meteors/meteor_3.png',
+            'images/meteors/meteor_4.png',
+        ], rle=False),
+        _many('meteors', 'meteor2', [
+            'images/meteors/meteor2_1.png',
+            'images/meteors/meteor2_2.png',
+            'images/meteors/meteor2_3.png',
+            'images/meteors/meteor2_4.png',
+        ], rle=False),
+        _many('black_holes', None, [
+            'images/hole/black_hole.png',
+            'images/hole/black_hole2.png',
+        ], rle=False),
+    ]),
+    ("Loading UI...", [
+        _one('ui', 'life_bar', 'images/life_bar.png'),
+        _one('ui', 'bullet_bar', 'images/bullet_bar.png'),
+    ]),
+]
+
+IMAGE_STEPS = MENU_STEPS + GAME_STEPS
+
+# Tiered entries start loading this many points before their threshold.
+PREFETCH_MARGIN = 1000
+
+
+def in_use(spec, score):
+    """True if *spec* is needed (or about to be) at *score*."""
+    return (spec.tier - PREFETCH_MARGIN <= score
+            and (spec.until is None or score < spec.until))
+
+
+# Untiered in-game sprites that are packed into texture atlas pages once
+# gameplay assets are in.  Tiered entries stay separate so they can be evicted.
+ATLAS_ATTRS = ('player', 'bullets', 'explosions', 'enemies', 'refills', 'meteors', 'black_holes')
+
+# Images that take part in hit tests get their collision masks at load time.
+MASK_ATTRS = ('player', 'bullets', 'enemies', 'bosses', 'meteors', 'black_holes')
+
+# Sprites that spin every frame; their frames come from the rotation cache.
+ROTATED_ATTRS = ('meteors', 'black_holes')
+
+
+def atlas_specs():
+    return [spec for _, specs in GAME_STEPS for spec in specs
+            if spec.attr in ATLAS_ATTRS and not spec.tiered and spec.mode == 'alpha']
+
+
+def surface_bytes(surf):
+    return surf.get_pitch() * surf.get_height()
+
+
+# Sound bank keys (see sound.SOUND_FILES)
+MENU_SOUNDS = ['menu_explosion']
+
+GAME_SOUNDS = [key for key in sound.SOUND_FILES if key not in MENU_SOUNDS]
+
+
+def finish_surface(spec, surf):
+    """Convert a freshly decoded surface to display format (main thread only)."""
+    surf = surfaces.prepare(surf, alpha=spec.mode == 'alpha')
+    if spec.size is not None:
+        surf = pygame.transform.scale(surf, spec.size)
+    return surf
+
+
+def load_loose(spec):
+    """Decode the source files of *spec* from disk; returns a list of surfaces."""
+    return [finish_surface(spec, pygame.image.load(path)) for path in spec.paths]
+
+
+def _file_size(path):
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+# ---------------------------------------------------------------------------
+#  Parallel loader — workers decode, the calling thread converts and stores
+# ---------------------------------------------------------------------------
+
+class AssetLoader:
+    """Decodes manifest entries on a thread pool.
+
+    ``pygame.image.load`` and mixer decoding release the GIL, so decode time
+    scales with the number of workers.  Display-format conversion and
+    storing into GameAssets happen in :meth:`pump`, on the calling thread.
+    Progress is counted in source-file bytes.
+    """
+
+    def __init__(self, assets, steps, sounds, pack=None, workers=None):
+        self.assets = assets
+        self.total_bytes = 0
+        self.done_bytes = 0
+        self.message = "Loading..."
+        self._executor = ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 4)
+        self._pending = {}   # future -> (message, nbytes, finish callback, args)
+        self._partial = {}   # spec -> decoded surfaces so far
+        self._step_left = {}  # message -> jobs still pending (for startup tracing)
+
+        for message, specs in steps:
+            for spec in specs:
+                self._submit_image(spec, pack, message)
+        bank = sound.get_bank()
+        by_path = {}
+        for key in sounds:
+            by_path.setdefault(bank.path(key), []).append(key)
+        for path, keys in by_path.items():
+            if bank.is_decoded(path):
+                bank.preload(keys)
+            else:
+                self._submit("Loading sounds...", path, self._finish_sound,
+                             sound.load_sound, path, keys)
+        if not self._pending:
+            self._executor.shutdown(wait=False)
+
+    # -- progress --
+
+    @property
+    def done(self):
+        return not self._pending
+
+    @property
+    def progress(self):
+        """Fraction of source bytes decoded and stored (0.0 – 1.0)."""
+        return self.done_bytes / self.total_bytes if self.total_bytes else 1.0
+
+    def pump(self, timeout=0, budget=None):
+        """Finish decodes that complete within *timeout* seconds.
+
+        *budget* caps the seconds spent converting on this call, so a menu
+        can pump every frame without dropping frames; leftovers are picked
+        up by the next call.
+        """
+        if not self._pending:
+            return
+        start = time.perf_counter()
+        finished, _ = wait(self._pending, timeout=timeout, return_when=FIRST_COMPLETED)
+        for fut in finished:
+            message, nbytes, finish, args = self._pending.pop(fut)
+            finish(fut.result(), *args)
+            self.done_bytes += nbytes
+            self.message = message
+            self._step_left[message] -= 1
+            if not self._step_left[message]:
+                profiler.mark(f"assets: {message} done")
+            if budget is not None and time.perf_counter() - start > budget:
+                break
+        if not self._pending:
+            self._executor.shutdown(wait=False)
+
+    # -- submission --
+
+    def _submit(self, message, path, finish, decode, *args, counted=False):
+        nbytes = _file_size(path)
+        if not counted:
+            self.total_bytes += nbytes
+        fut = self._executor.submit(decode, path)
+        self._pending[fut] = (message, nbytes, finish, args)
+        self._step_left[message] = self._step_left.get(message, 0) + 1
+
+    def _submit_image(self, spec, pack, message):
+        if pack is not None and pack.has(spec.names):
+            # source hashing runs on a worker; surfaces are built in _finish_packed
+            self.total_bytes += sum(_file_size(p) for p in spec.paths)
+            fut = self._executor.submit(pack.is_fresh, spec.paths)
+            self._pending[fut] = (message, 0, self._finish_packed, (spec, pack, message))
+            self._step_left[message] = self._step_left.get(message, 0) + 1
+            return
+        self._submit_loose(spec, message)
+
+    def _submit_loose(self, spec, message, counted=False):
+        self._partial[spec] = [None] * len(spec.paths)
+        for i, path in enumerate(spec.paths):
+            self._submit(message, path, self._finish_image, pygame.image.load,
+                         spec, i, counted=counted)
+
+    # -- main-thread completion --
+
+    def _finish_packed(self, fresh, spec, pack, message):
+        images = pack.get(spec.names, spec.paths, spec.mode == 'opaque') if fresh else None
+        if images is None:
+            self._submit_loose(spec, message, counted=True)
+            return
+        self.done_bytes += sum(_file_size(p) for p in spec.paths)
+        self.assets._store(spec, images)
+
+    def _finish_image(self, surf, spec, index):
+        parts = self._partial[spec]
+        parts[index] = finish_surface(spec, surf)
+        if all(p is not None for p in parts):
+            del self._partial[spec]
+            self.assets._store(spec, parts)
+
+    def _finish_sound(self, snd, path, keys):
+        bank = sound.get_bank()
+        bank.store(path, snd)
+        bank.preload(keys)
+
+
+# ---------------------------------------------------------------------------
+#  Lazy slots — tiered entries load on first access
+# ---------------------------------------------------------------------------
+
+class _TierSlots(dict):
+    """Asset dict that loads missing tiered entries on access and tracks recency."""
+
+    def __init__(self, owner, attr):
+        super().__init__()
+        self._owner = owner
+        self._attr = attr
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self._owner._touch(self._attr, key)
+        return value
+
+    def __missing__(self, key):
+        return self._owner._load_now(self._attr, key)
+
+
+class SlotView(Sequence):
+    """Read-only sequence over asset slots, resolved on every access."""
+
+    def __init__(self, slots, keys):
+        self._slots = slots
+        self._keys = tuple(keys)
+
+    def __getitem__(self, index):
+        return self._slots[self._keys[index]]
+
+    def __len__(self):
+        return len(self._keys)
 
 
 class GameAssets:
-    """Centralized asset storage loaded once at startup."""
+    """Centralized asset storage.
+
+    Untiered assets stay resident for the session.  Tiered ones (late
+    backgrounds and bosses) are prefetched as the score approaches their
+    threshold via :meth:`update_tiers`, and evicted least-recently-used first
+    once the images the game holds (:meth:`resident_bytes`) exceed
+    *memory_budget* bytes and they are out of use.
+    """
 
-    def __init__(self):
+    def __init__(self, memory_budget=ASSET_MEMORY_BUDGET):
         # Backgrounds
-        self.backgrounds = {}
+        self.backgrounds = _TierSlots(self, 'backgrounds')
+
+        # Player ship & projectiles
+        self.player = {}
+        self.bullets = {}
 
         # Explosion animation frames
         self.explosions = {}
 
         # Enemy & boss images
         self.enemies = {}
-        self.bosses = {}
+        self.bosses = _TierSlots(self, 'bosses')
 
         # Powerups & refills
         self.refills = {}
@@ -32,115 +402,246 @@ class GameAssets:
         # Menu assets
         self.menu = {}
 
-        # Sound effects
-        self.sounds = {}
+        # Texture atlas for small sprites (built when loading finishes), and
+        # its copy at the internal render scale when that is below 1
+        self.atlas = None
+        self.render_atlas = None
+
+        # Sound effects (shared bank, keyed like sound.SOUND_FILES)
+        self.sounds = sound.get_bank()
+
+        # Loading state
+        self._pack = None
+        self._pack_opened = False
+        self._loader = None
+        self._prefetching = []
+        self.ready = False
+
+        # Residency: bytes per stored spec, LRU order of tiered specs
+        self.memory_budget = memory_budget
+        self._specs = {(s.attr, s.key): s for _, specs in IMAGE_STEPS for s in specs}
+        self._bytes = {}
+        self._resident = OrderedDict()
+        self._inflight = set()
+        self._tier_score = 0
 
     def load_all(self, screen=None):
-        """Load all game assets. Pass screen to show loading progress."""
-        steps = [
-            ("Loading backgrounds...", self._load_backgrounds),
-            ("Loading explosions...", self._load_explosions),
-            ("Loading enemies...", self._load_enemies),
-            ("Loading bosses...", self._load_bosses),
-            ("Loading powerups...", self._load_refills),
-            ("Loading meteors...", self._load_meteors),
-            ("Loading UI...", self._load_ui),
-            ("Loading menu...", self._load_menu),
-            ("Loading sounds...", self._load_sounds),
-        ]
-        for message, loader in steps:
+        """Load all game assets, blocking. Pass screen to show loading progress."""
+        self.load_menu(screen)
+        self.wait_ready(screen)
+
+    # ---- staged loading ----
+
+    def load_menu(self, screen=None):
+        """Load the menu stage (blocking) and start streaming the rest.
+
+        Images come from the pre-decoded asset pack when it is present and
+        up to date; everything else is decoded in parallel by AssetLoader
+        while this thread converts the results.
+        """
+        with profiler.trace("menu assets"):
+            self._run(AssetLoader(self, MENU_STEPS, MENU_SOUNDS, self._get_pack()), screen)
+        self.start_loading()
+
+    def start_loading(self):
+        """Start decoding gameplay assets in the background (idempotent).
+
+        Only entries in use at score 0 are loaded; later tiers wait for
+        :meth:`update_tiers` or their first access.
+        """
+        if self._loader is None and not self.ready:
+            steps = [(message, [s for s in specs if in_use(s, 0)])
+                     for message, specs in GAME_STEPS]
+            for _, specs in steps:
+                self._inflight.update(specs)
+            self._loader = AssetLoader(self, steps, GAME_SOUNDS, self._get_pack())
+
+    def pump(self, budget=0.004):
+        """Store finished background decodes; call once per frame."""
+        if self._loader is not None:
+            self._loader.pump(budget=budget)
+            if self._loader.done:
+                self._finish_loading()
+        if self._prefetching:
+            for loader in self._prefetching:
+                loader.pump(budget=budget)
+            self._prefetching = [l for l in self._prefetching if not l.done]
+
+    def wait_ready(self, screen=None):
+        """Block until gameplay assets are loaded, showing progress on *screen*."""
+        if self.ready:
+            return
+        self.start_loading()
+        self._run(self._loader, screen)
+        self._finish_loading()
+
+    def _run(self, loader, screen):
+        # bundled font: the loading screen must not wait for font discovery
+        font = fonts.get_font(None, 36) if screen else None
+        while not loader.done:
+            loader.pump(timeout=1 / 60)
             if screen:
-                self._show_loading(screen, message)
-            loader()
-
-        if screen:
-            self._show_loading(screen, "Ready!")
-            pygame.time.delay(300)
+                self._show_loading(screen, font, loader.message, loader.progress)
+
+    def _finish_loading(self):
+        with profiler.trace("texture atlas"):
+            self._build_atlas()
+        with profiler.trace("rotation cache"):
+            self._register_rotations()
+        self.ready = True
+        self._loader = None
+        profiler.mark("gameplay assets ready")
+
+    def _build_atlas(self):
+        """Move the small sprites onto atlas pages and store their subsurfaces.
+
+        The pack's prebuilt atlas is used when it is up to date; otherwise the
+        pages are packed from the surfaces just loaded.
+        """
+        specs = atlas_specs()
+        pack = self._get_pack()
+        names = [name for spec in specs for name in spec.names]
+        built = pack.atlas(names, [p for spec in specs for p in spec.paths]) if pack else None
+        if built is None:
+            built = atlas.build([(name, image, spec.rle)
+                                 for spec in specs
+                                 for name, image in zip(spec.names, self._images(spec))])
+        for spec in specs:
+            images = [built.image(name) for name in spec.names]
+            self._set(spec, images if spec.many else images[0])
+            if spec.attr in MASK_ATTRS:
+                masks.precompute(images)
+            self._bytes[spec] = 0  # counted once, as whole pages
+        self.atlas = built.accelerate()  # after the masks, as in _store
+
+        scale = viewport.get_scale()
+        if scale != 1:
+            self.render_atlas = atlas.build([(name, viewport.scale_image(built.image(name), scale), spec.rle)
+                                             for spec in specs for name in spec.names]).accelerate()
+            atlas.set_render_atlas(built, self.render_atlas)
+
+    def _get_pack(self):
+        if not self._pack_opened:
+            self._pack_opened = True
+            self._pack = assetpack.open_pack()
+        return self._pack
 
     # ---- loading screen ----
 
-    def _show_loading(self, screen, message):
-        """Display a loading message on a black screen."""
+    def _show_loading(self, screen, font, message, progress):
+        """Display a loading message and progress bar on a black screen."""
+        pygame.event.pump()
         screen.fill((0, 0, 0))
-        font = pygame.font.SysFont('Arial', 30)
         text = font.render(message, True, (255, 255, 255))
-        text_rect = text.get_rect(center=(WIDTH // 2, HEIGHT // 2))
+        text_rect = text.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 30))
         screen.blit(text, text_rect)
+
+        bar = pygame.Rect(0, 0, WIDTH // 2, 20)
+        bar.center = (WIDTH // 2, HEIGHT // 2 + 20)
+        pygame.draw.rect(screen, (255, 255, 255), bar, width=2)
+        fill = bar.inflate(-6, -6)
+        fill.width = int(fill.width * progress)
+        pygame.draw.rect(screen, (152, 251, 152), fill)
         pygame.display.flip()
-        pygame.time.delay(80)
-
-    # ---- private loaders ----
-
-    def _load_backgrounds(self):
-        self.backgrounds['bg1'] = pygame.image.load('images/bg/background.jpg').convert()
-        self.backgrounds['bg2'] = pygame.image.load('images/bg/background2.png').convert()
-        self.backgrounds['bg3'] = pygame.image.load('images/bg/background3.png').convert()
-        self.backgrounds['bg4'] = pygame.image.load('images/bg/background4.png').convert()
-
-    def _load_explosions(self):
-        self.explosions['explosion1'] = [
-            pygame.image.load(f"images/explosion/explosion{i}.png") for i in range(8)
-        ]
-        self.explosions['explosion2'] = [
-            pygame.image.load(f"images/explosion2/explosion{i}.png") for i in range(18)
-        ]
-        self.explosions['explosion3'] = [
-            pygame.image.load(f"images/explosion3/explosion{i}.png") for i in range(18)
-        ]
-
-    def _load_enemies(self):
-        self.enemies['enemy1'] = [
-            pygame.image.load('images/enemy/enemy1_1.png').convert_alpha(),
-            pygame.image.load('images/enemy/enemy1_2.png').convert_alpha(),
-            pygame.image.load('images/enemy/enemy1_3.png').convert_alpha(),
-        ]
-        self.enemies['enemy2'] = [
-            pygame.image.load('images/enemy/enemy2_1.png').convert_alpha(),
-            pygame.image.load('images/enemy/enemy2_2.png').convert_alpha(),
-        ]
-
-    def _load_bosses(self):
-        self.bosses['boss1'] = pygame.image.load('images/boss/boss1.png').convert_alpha()
-        self.bosses['boss2'] = pygame.image.load('images/boss/boss2_1.png').convert_alpha()
-        self.bosses['boss3'] = pygame.image.load('images/boss/boss3.png').convert_alpha()
-
-    def _load_refills(self):
-        self.refills['health'] = pygame.image.load('images/refill/health_refill.png').convert_alpha()
-        self.refills['bullet'] = pygame.image.load('images/refill/bullet_refill.png').convert_alpha()
-        self.refills['double'] = pygame.image.load('images/refill/double_refill.png').convert_alpha()
-        self.refills['extra_score'] = pygame.image.load('images/score/score_coin.png').convert_alpha()
-
-    def _load_meteors(self):
-        self.meteors['meteor1'] = [
-            pygame.image.load('images/meteors/meteor_1.png').convert_alpha(),
-            pygame.image.load('images/meteors/meteor_2.png').convert_alpha(),
-            pygame.image.load('images/meteors/meteor_3.png').convert_alpha(),
-            pygame.image.load('images/meteors/meteor_4.png').convert_alpha(),
-        ]
-        self.meteors['meteor2'] = [
-            pygame.image.load('images/meteors/meteor2_1.png').convert_alpha(),
-            pygame.image.load('images/meteors/meteor2_2.png').convert_alpha(),
-            pygame.image.load('images/meteors/meteor2_3.png').convert_alpha(),
-            pygame.image.load('images/meteors/meteor2_4.png').convert_alpha(),
-        ]
-        self.black_holes = [
-            pygame.image.load('images/hole/black_hole.png').convert_alpha(),
-            pygame.image.load('images/hole/black_hole2.png').convert_alpha(),
-        ]
-
-    def _load_ui(self):
-        self.ui['life_bar'] = pygame.image.load("images/life_bar.png").convert_alpha()
-        self.ui['bullet_bar'] = pygame.image.load("images/bullet_bar.png").convert_alpha()
-
-    def _load_menu(self):
-        img = pygame.image.load('images/mainmenu.jpg').convert()
-        self.menu['background'] = pygame.transform.scale(img, (WIDTH, HEIGHT))
-        self.menu['logo'] = pygame.image.load('images/ch.png').convert_alpha()
-
-    def _load_sounds(self):
-        self.sounds['warning'] = sound.load_sound('game_sounds/warning.mp3')
-        self.sounds['menu_explosion'] = sound.load_sound('game_sounds/explosions/explosion1.wav')
-        self.sounds['menu_explosion'].set_volume(0.25)
+
+    # ---- score tiers & memory budget ----
+
+    def update_tiers(self, score):
+        """Prefetch tiers the score is approaching; evict those out of use.
+
+        Only does work when the score changed; call once per frame.
+        """
+        self.pump()
+        if score == self._tier_score:
+            return
+        self._tier_score = score
+        wanted = [spec for spec in self._specs.values()
+                  if spec.tiered and in_use(spec, score)
+                  and spec not in self._bytes and spec not in self._inflight]
+        if wanted:
+            self._inflight.update(wanted)
+            self._prefetching.append(
+                AssetLoader(self, [("Prefetching...", wanted)], [], self._get_pack()))
+        self._evict(score)
+
+    def resident_bytes(self):
+        """Pixel bytes of every decoded image the game holds.
+
+        Counts the store itself, the atlas pages, the rotation cache's
+        frames and the viewport's render-scale variants.  Only tiered specs
+        can be evicted, but the budget is checked against all of it.
+        """
+        pages = sum(a.nbytes() for a in (self.atlas, self.render_atlas) if a is not None)
+        derived = rotation.get_cache().nbytes() + viewport.variant_bytes()
+        return pages + derived + sum(self._bytes.values())
+
+    def _evict(self, score):
+        over = self.resident_bytes() - self.memory_budget
+        for spec in list(self._resident):
+            if over <= 0:
+                break
+            if in_use(spec, score):
+                continue
+            dict.__delitem__(getattr(self, spec.attr), spec.key)
+            del self._resident[spec]
+            over -= self._bytes.pop(spec)
+
+    def _touch(self, attr, key):
+        spec = self._specs.get((attr, key))
+        if spec in self._resident:
+            self._resident.move_to_end(spec)
+
+    def _load_now(self, attr, key):
+        """Synchronously load a slot that was never loaded or was evicted."""
+        spec = self._specs.get((attr, key))
+        if spec is None:
+            raise KeyError(key)
+        pack = self._get_pack()
+        images = pack.get(spec.names, spec.paths, spec.mode == 'opaque') if pack else None
+        if images is None:
+            images = load_loose(spec)
+        self._store(spec, images)
+        return dict.__getitem__(getattr(self, attr), key)
+
+    # ---- private helpers ----
+
+    def _store(self, spec, images):
+        """Store loaded surfaces for *spec*, enforcing display format."""
+        alpha = spec.mode == 'alpha'
+        images = [surfaces.prepare(s, alpha) for s in images]
+        if spec.attr in MASK_ATTRS and spec.attr not in ATLAS_ATTRS:
+            masks.precompute(images)  # atlas sprites get theirs once packed
+        if alpha and spec.rle:
+            for image in images:
+                surfaces.accelerate(image)  # after the masks: reading pixels decodes RLE
+        self._set(spec, images if spec.many else images[0])
+        self._bytes[spec] = sum(surface_bytes(s) for s in images)
+        self._inflight.discard(spec)
+        if spec.tiered:
+            self._resident[spec] = True
+            self._resident.move_to_end(spec)
+
+
+    def _register_rotations(self):
+        """Name the spinning sprites for the rotation cache and load its frames."""
+        cache = rotation.get_cache()
+        for spec in self._specs.values():
+            if spec.attr in ROTATED_ATTRS:
+                for name, image, path in zip(spec.names, self._images(spec), spec.paths):
+                    cache.register(name, image, [path])
+        cache.load()
+
+    def _set(self, spec, value):
+        if spec.key is None:
+            setattr(self, spec.attr, value)
+        else:
+            dict.__setitem__(getattr(self, spec.attr), spec.key, value)
+
+    def _images(self, spec):
+        """Stored surfaces of *spec* as a list."""
+        value = (getattr(self, spec.attr) if spec.key is None
+                 else dict.__getitem__(getattr(self, spec.attr), spec.key))
+        return value if spec.many else [value]
 
 
 # ---- singleton access ----
@@ -161,3 +662,10 @@ def load_all_assets(screen=None):
     assets = get_assets()
     assets.load_all(screen)
     return assets
+
+
+def load_menu_assets(screen=None):
+    """Load menu assets and keep streaming gameplay assets in the background."""
+    assets = get_assets()
+    assets.load_menu(screen)
+    return assets
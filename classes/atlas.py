@@ -0,0 +1,136 @@
+"""Texture atlas — packs many small sprites into a few large page surfaces.
+
+Sprites are placed with a shelf packer (tallest first) and exposed as
+subsurfaces of their page, so entity code keeps working with ordinary
+surfaces.  The renderer asks :func:`source` for the page and source rect of
+an atlas sprite and blits straight from the page, which lets whole groups
+go through one ``Surface.blits`` call.
+
+RLE-eligible sprites and sprites used as rotation sources live on separate
+pages: locking an RLE page (which any pixel access through a subsurface
+does) would throw its encoding away.
+"""
+import pygame
+
+PAGE_SIZE = (1024, 1024)
+PADDING = 1
+
+# every atlas sprite -> (page surface, source rect), for the renderer
+_sources = {}
+# every atlas sprite -> (page, rect) of its variant in the render-scale atlas
+_render_sources = {}
+
+
+def layout(sizes, page_size=PAGE_SIZE, padding=PADDING):
+    """Place *sizes* on shelves; returns [(page index, x, y)] in input order."""
+    pw, ph = page_size
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    placements = [None] * len(sizes)
+    page = x = y = shelf_h = 0
+    for i in order:
+        w, h = sizes[i]
+        if w > pw or h > ph:
+            raise ValueError(f"sprite {w}x{h} does not fit a {pw}x{ph} atlas page")
+        if x + w > pw:
+            x, y, shelf_h = 0, y + shelf_h + padding, 0
+        if y + h > ph:
+            page, x, y, shelf_h = page + 1, 0, 0, 0
+        placements[i] = (page, x, y)
+        x += w + padding
+        shelf_h = max(shelf_h, h)
+    return placements
+
+
+class Atlas:
+    """A set of pages plus the rect of every named sprite on them."""
+
+    def __init__(self, pages, rects, rle):
+        self.pages = pages      # list of surfaces
+        self.rects = rects      # name -> (page index, pygame.Rect)
+        self.rle = rle          # per page: RLE-accelerate? (see accelerate)
+        self._images = {}
+        for name, (index, rect) in rects.items():
+            page = pages[index]
+            image = page.subsurface(rect)
+            self._images[name] = image
+            _sources[image] = (page, rect)
+
+    def __contains__(self, name):
+        return name in self._images
+
+    def image(self, name):
+        """Subsurface for sprite *name*."""
+        return self._images[name]
+
+    def accelerate(self):
+        """RLE-accelerate the pages flagged for it.
+
+        Pages come back from :func:`build` and :meth:`from_layout` without
+        RLE so collision masks can be read from them first.
+        """
+        for page, flag in zip(self.pages, self.rle):
+            if flag:
+                page.set_alpha(255, pygame.RLEACCEL)
+        return self
+
+    def nbytes(self):
+        return sum(p.get_pitch() * p.get_height() for p in self.pages)
+
+    def to_layout(self):
+        """JSON-friendly description: page sizes/flags and sprite rects."""
+        return {
+            'pages': [[p.get_width(), p.get_height(), rle]
+                      for p, rle in zip(self.pages, self.rle)],
+            'sprites': {name: [i, r.x, r.y, r.w, r.h] for name, (i, r) in self.rects.items()},
+        }
+
+    @classmethod
+    def from_layout(cls, pages, data):
+        """Rebuild an atlas from stored *pages* and a :meth:`to_layout` dict."""
+        rle = [flag for _, _, flag in data['pages']]
+        rects = {name: (i, pygame.Rect(x, y, w, h))
+                 for name, (i, x, y, w, h) in data['sprites'].items()}
+        return cls(pages, rects, rle)
+
+
+def build(entries):
+    """Pack *entries* — (name, surface, rle) tuples — into a new Atlas."""
+    pages = []
+    rects = {}
+    flags = []
+    for rle in (True, False):
+        group = [(name, surf) for name, surf, r in entries if r == rle]
+        if not group:
+            continue
+        places = layout([surf.get_size() for _, surf in group])
+        first = len(pages)
+        heights = {}
+        for (_, surf), (index, x, y) in zip(group, places):
+            heights[index] = max(heights.get(index, 0), y + surf.get_height())
+        for index in sorted(heights):
+            page = pygame.Surface((PAGE_SIZE[0], heights[index]), pygame.SRCALPHA).convert_alpha()
+            page.fill((0, 0, 0, 0))
+            pages.append(page)
+            flags.append(rle)
+        for (name, surf), (index, x, y) in zip(group, places):
+            # MAX onto a cleared page copies pixels exactly (no alpha blending)
+            pages[first + index].blit(surf, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+            rects[name] = (first + index, pygame.Rect((x, y), surf.get_size()))
+    return Atlas(pages, rects, flags)
+
+
+def source(image):
+    """(page, rect) to blit *image* from, or (image, None) if it is not in an atlas."""
+    return _sources.get(image) or (image, None)
+
+
+def set_render_atlas(world, render):
+    """Draw *world*'s sprites from *render*, a copy packed at render scale."""
+    _render_sources.clear()
+    for name, (index, rect) in render.rects.items():
+        _render_sources[world.image(name)] = (render.pages[index], rect)
+
+
+def render_source(image, scale):
+    """Like :func:`source`, at render scale; *scale* makes variants of non-atlas images."""
+    return _render_sources.get(image) or (scale(image), None)
@@ -1,15 +1,36 @@
-"""Boss sprite classes."""
+"""Boss sprite classes.
+
+Bosses fire into the shared boss ProjectileField; what they fire is data —
+each class lists ``(pattern name, period in frames)`` pairs in ``attacks``
+(see patterns.py), the first being the volley counted by ``shots_fired``.
+"""
 import math
 import random
 
 import pygame
 
 from .constants import WIDTH, HEIGHT
-from .bullets import Boss1Bullet, Boss2Bullet, Boss3Bullet
+from . import patterns
+
+
+def _attack(boss, field, player):
+    """Advance *boss*'s fire timer and fire the attacks now due.
+
+    Returns True when the primary (first) attack fired.
+    """
+    boss.shoot_timer += 1
+    x, y = boss.rect.centerx, boss.rect.bottom
+    primary = False
+    for i, (name, period) in enumerate(boss.attacks):
+        if boss.shoot_timer % period == 0:
+            patterns.fire(field, name, x, y, player.rect.center, boss.shoot_timer // period - 1,
+                          damage=boss.bullet_damage)
+            primary = primary or i == 0
+    return primary
 
 
 class Boss1(pygame.sprite.Sprite):
-    """First boss — moves side to side, fires triple bullets."""
+    """First boss — moves side to side, fires triple bullets and spinning rings."""
 
     # combat attributes (read by collisions.py)
     contact_damage = 20
@@ -17,6 +38,7 @@ class Boss1(pygame.sprite.Sprite):
     score_on_kill = 400
     bullet_damage = 20
     drop_chance = 20   # 1-in-N for double refill
+    attacks = (('boss1_triple', 60), ('boss1_ring', 150))
 
     def __init__(self, x, y, image):
         super().__init__()
@@ -27,7 +49,7 @@ class Boss1(pygame.sprite.Sprite):
         self.shoot_timer = 0
         self.shots_fired = 0
 
-    def update(self, enemy_bullets_group, player):
+    def update(self, field, player):
         self.rect.x += math.sin(pygame.time.get_ticks() * 0.01) * 3
         self.rect.y += math.sin(pygame.time.get_ticks() * 0.01) * 3
         if self.shots_fired < 20:
@@ -42,26 +64,22 @@ class Boss1(pygame.sprite.Sprite):
                 self.rect.right = WIDTH - 5
                 self.direction = (-1, 0)
 
-            self.shoot_timer += 1
-            if self.shoot_timer >= 60:
-                bullet1 = Boss1Bullet(self.rect.centerx - 20, self.rect.bottom)
-                bullet2 = Boss1Bullet(self.rect.centerx + 20, self.rect.bottom)
-                bullet3 = Boss1Bullet(self.rect.centerx, self.rect.bottom)
-                enemy_bullets_group.add(bullet1, bullet2, bullet3)
-                self.shoot_timer = 0
+            if _attack(self, field, player):
                 self.shots_fired += 1
         else:
             self.speed = 10
             dx = player.rect.centerx - self.rect.centerx
             dy = player.rect.centery - self.rect.centery
-            direction = pygame.math.Vector2(dx, dy).normalize()
+            direction = pygame.math.Vector2(dx, dy)
+            if direction:  # zero when centred on the player
+                direction.normalize_ip()
 
             self.rect.x += direction.x * self.speed
             self.rect.y += direction.y * self.speed
 
 
 class Boss2(pygame.sprite.Sprite):
-    """Second boss — 8-directional movement, homing bullets."""
+    """Second boss — 8-directional movement, aimed shots and fans."""
 
     # combat attributes
     contact_damage = 2
@@ -69,6 +87,7 @@ class Boss2(pygame.sprite.Sprite):
     score_on_kill = 800
     bullet_damage = 20
     drop_chance = 20
+    attacks = (('boss2_aimed', 100), ('boss2_fan', 250))
 
     def __init__(self, x, y, image):
         super().__init__()
@@ -81,7 +100,7 @@ class Boss2(pygame.sprite.Sprite):
         self.shoot_timer = 0
         self.shots_fired = 0
 
-    def update(self, enemy_bullets_group, player):
+    def update(self, field, player):
         self.rect.x += math.sin(pygame.time.get_ticks() * 0.01) * 2
         self.rect.y += math.sin(pygame.time.get_ticks() * 0.01) * 2
         if self.shots_fired < 20:
@@ -115,21 +134,16 @@ class Boss2(pygame.sprite.Sprite):
                     self.direction_x = 1
 
             self.direction = (self.direction_x, self.direction_y)
-            self.shoot_timer += 1
-            if self.shoot_timer >= 100:
-                dx = player.rect.centerx - self.rect.centerx
-                dy = player.rect.centery - self.rect.centery
-                direction = pygame.math.Vector2(dx, dy).normalize()
-                bullet = Boss2Bullet(self.rect.centerx, self.rect.bottom, direction)
-                enemy_bullets_group.add(bullet)
-                self.shoot_timer = 0
+            if _attack(self, field, player):
                 self.shots_fired += 1
         else:
             if self.speed != 5:
                 self.speed = 5 / math.sqrt(2)
             dx = player.rect.centerx - self.rect.centerx
             dy = player.rect.centery - self.rect.centery
-            direction = pygame.math.Vector2(dx, dy).normalize()
+            direction = pygame.math.Vector2(dx, dy)
+            if direction:  # zero when centred on the player
+                direction.normalize_ip()
 
             self.rect.x += direction.x * self.speed
             self.rect.y += direction.y * self.speed
@@ -140,7 +154,7 @@ class Boss2(pygame.sprite.Sprite):
 
 
 class Boss3(pygame.sprite.Sprite):
-    """Third boss — teleports, homing bullets, 8-directional movement."""
+    """Third boss — teleports, aimed shots and a spiral, 8-directional movement."""
 
     # combat attributes
     contact_damage = 1
@@ -148,6 +162,7 @@ class Boss3(pygame.sprite.Sprite):
     score_on_kill = 1000
     bullet_damage = 20
     drop_chance = 20
+    attacks = (('boss3_aimed', 120), ('boss3_spiral', 12))
 
     def __init__(self, x, y, image):
         super().__init__()
@@ -162,7 +177,7 @@ class Boss3(pygame.sprite.Sprite):
         self.teleport_timer = 0
         self.teleport_interval = 160
 
-    def update(self, enemy_bullets_group, player):
+    def update(self, field, player):
         self.rect.x += math.sin(pygame.time.get_ticks() * 0.01) * 2
         self.rect.y += math.sin(pygame.time.get_ticks() * 0.01) * 2
         if self.shots_fired < 20:
@@ -196,21 +211,16 @@ class Boss3(pygame.sprite.Sprite):
                     self.direction_x = 1
 
             self.direction = (self.direction_x, self.direction_y)
-            self.shoot_timer += 1
-            if self.shoot_timer >= 120:
-                dx = player.rect.centerx - self.rect.centerx
-                dy = player.rect.centery - self.rect.centery
-                direction = pygame.math.Vector2(dx, dy).normalize()
-                bullet = Boss3Bullet(self.rect.centerx, self.rect.bottom, direction)
-                enemy_bullets_group.add(bullet)
-                self.shoot_timer = 0
+            if _attack(self, field, player):
                 self.shots_fired += 1
         else:
             if self.speed != 5:
                 self.speed = 5 / math.sqrt(2)
             dx = player.rect.centerx - self.rect.centerx
             dy = player.rect.centery - self.rect.centery
-            direction = pygame.math.Vector2(dx, dy).normalize()
+            direction = pygame.math.Vector2(dx, dy)
+            if direction:  # zero when centred on the player
+                direction.normalize_ip()
 
             self.rect.x += direction.x * self.speed
             self.rect.y += direction.y * self.speed
@@ -1,117 +1,63 @@
-"""All projectile (bullet) sprites: player, enemy, and boss bullets."""
-import math
+"""Projectile sprites: player and Enemy2 bullets.
 
-import pygame
+Boss bullets live in the boss ProjectileField (projectiles.py).  Both
+classes here are pooled (see pools.py).
 
+Every projectile remembers where its rect was before its last move
+(``prev_pos``) so collisions can sweep the path instead of only testing the
+end point.
+"""
 from .constants import HEIGHT
+from .assets import get_assets
+from . import ecs
 from . import sound
-
-
-class Bullet(pygame.sprite.Sprite):
-    """Player bullet — flies upward."""
-
-    def __init__(self, x, y):
-        super().__init__()
-        self.image = pygame.image.load('images/bullets/bullet1.png').convert_alpha()
-        self.rect = self.image.get_rect()
-        self.rect.centerx = x
-        self.rect.bottom = y - 10
-        self.speed = 10
-        self.shoot_sound = sound.load_sound('game_sounds/shooting/shoot.mp3')
-        self.shoot_sound.set_volume(0.4)
+from .pools import Pooled
+
+
+class Bullet(Pooled, ecs.Entity):
+    """Player bullet — flies upward.
+
+    Runs on the ECS: *world*'s movement system moves it and its lifetime
+    system removes it once it reaches the top of the screen.  Recycled
+    bullets keep their Rect.
+    """
+
+    speed = 10
+
+    def __init__(self, x, y, world):
+        image = get_assets().bullets['player']
+        rect = getattr(self, 'rect', None)   # a recycled bullet's slot still holds it
+        if rect is None:
+            rect = image.get_rect()
+        rect.centerx = x
+        rect.bottom = y - 10
+        eid = world.spawn(
+            ecs.Position(*rect.topleft),
+            ecs.Velocity(0, -self.speed),
+            ecs.Image(image),
+            ecs.Collider(rect),
+            ecs.Lifetime(top=1),
+        )
+        super().__init__(world, eid)
+        self.shoot_sound = sound.get_bank()['shoot']
         self.shoot_sound.play()
 
-    def update(self):
-        self.rect.move_ip(0, -self.speed)
-        if self.rect.top <= 1:
-            self.kill()
-
 
-class Enemy2Bullet(pygame.sprite.Sprite):
-    """Bullet fired by Enemy2 — drops straight down."""
+class Enemy2Bullet(Pooled):
+    """Bullet fired by Enemy2 — drops straight down, dealing *damage* on a hit."""
 
-    def __init__(self, x, y):
+    def __init__(self, x, y, damage):
         super().__init__()
-        self.image = pygame.image.load('images/bullets/bullet4.png').convert_alpha()
-        self.rect = self.image.get_rect()
-        self.rect.centerx = x
-        self.rect.bottom = y + 10
+        self.damage = damage
+        self.image = get_assets().bullets['enemy2']
+        self.place(self.image, centerx=x, bottom=y + 10)
         self.speed = 8
-        self.shoot_sound = sound.load_sound('game_sounds/shooting/shoot2.mp3')
-        self.shoot_sound.set_volume(0.3)
-        self.shoot_sound.play()
-
-    def update(self):
-        self.rect.move_ip(0, self.speed)
-        if self.rect.top > HEIGHT:
-            self.kill()
-
-
-class Boss1Bullet(pygame.sprite.Sprite):
-    """Bullet fired by Boss1 — drops straight down, fast."""
-
-    def __init__(self, x, y):
-        super().__init__()
-        self.image = pygame.image.load('images/bullets/bulletboss1.png').convert_alpha()
-        self.rect = self.image.get_rect()
-        self.rect.centerx = x
-        self.rect.bottom = y + 10
-        self.speed = 10
-        self.shoot_sound = sound.load_sound('game_sounds/shooting/boss1shoot.mp3')
-        self.shoot_sound.set_volume(0.4)
+        self.prev_pos = self.rect.topleft
+        self.shoot_sound = sound.get_bank()['enemy2_shoot']
         self.shoot_sound.play()
 
     def update(self):
+        self.prev_pos = self.rect.topleft
         self.rect.move_ip(0, self.speed)
         if self.rect.top > HEIGHT:
             self.kill()
-
-
-class Boss2Bullet(pygame.sprite.Sprite):
-    """Homing bullet fired by Boss2 — follows a direction vector and rotates."""
-
-    def __init__(self, x, y, direction):
-        super().__init__()
-        self.image_orig = pygame.image.load('images/bullets/bulletboss2.png').convert_alpha()
-        self.image = self.image_orig
-        self.rect = self.image.get_rect()
-        self.rect.centerx = x
-        self.rect.bottom = y + 10
-        self.speed = 11
-        self.direction = direction
-        self.shoot_sound = sound.load_sound('game_sounds/shooting/boss2shoot.mp3')
-        self.shoot_sound.set_volume(0.4)
-        self.shoot_sound.play()
-
-    def update(self):
-        self.rect.move_ip(self.direction.x * self.speed, self.direction.y * self.speed)
-        angle = math.degrees(math.atan2(self.direction.y, self.direction.x))
-        self.image = pygame.transform.rotate(self.image_orig, -angle)
-        self.rect = self.image.get_rect(center=self.rect.center)
-        if self.rect.top > HEIGHT:
-            self.kill()
-
-
-class Boss3Bullet(pygame.sprite.Sprite):
-    """Homing bullet fired by Boss3 — faster variant of Boss2Bullet."""
-
-    def __init__(self, x, y, direction):
-        super().__init__()
-        self.image_orig = pygame.image.load('images/bullets/bulletboss3.png').convert_alpha()
-        self.image = self.image_orig
-        self.rect = self.image.get_rect()
-        self.rect.centerx = x
-        self.rect.bottom = y + 10
-        self.speed = 15
-        self.direction = direction
-        self.shoot_sound = sound.load_sound('game_sounds/shooting/boss2shoot.mp3')
-        self.shoot_sound.set_volume(0.4)
-        self.shoot_sound.play()
-
-    def update(self):
-        self.rect.move_ip(self.direction.x * self.speed, self.direction.y * self.speed)
-        angle = math.degrees(math.atan2(self.direction.y, self.direction.x))
-        self.image = pygame.transform.rotate(self.image_orig, -angle)
-        self.rect = self.image.get_rect(center=self.rect.center)
-        if self.rect.top > HEIGHT:
-            self.kill()
@@ -1,268 +1,246 @@
-"""Collision & update logic — generic functions that read entity class attributes."""
-import random
-
+"""Collision & update logic — generic functions that read entity class attributes.
+
+The ``process_*`` functions only detect what happened and emit it to
+``groups.events`` (see events.py); explosions, drops, sounds and scoring
+are handled by the bus consumers once per frame (consumers.py).
+
+Player bullets are looked up through ``groups.bullet_grid``, which the game
+loop rebuilds from ``groups.bullets`` once per frame before these run.
+Damage hits go through ``masks.collide`` (rect test, then pixel masks);
+projectiles are also swept along their last step so fast or thin ones
+cannot tunnel through a target.  Pickups keep plain rect tests so they stay
+easy to grab.  Boss bullets live in ``groups.boss_field``; ``process_boss_bullets``
+box-tests them all as arrays and mask-tests only the few that touch the
+player.
+
+Entities outside ``ACTIVE_BAND`` (pre-spawned above the screen, or drifting
+off it) still move every frame but skip all hit tests until they enter it.
+"""
 import pygame
 
-from .constants import WIDTH, HEIGHT
-from .explosions import Explosion, Explosion2
-from .refill import BulletRefill, HealthRefill, DoubleRefill
+from .enemies import separate
+from .events import Kill, Pickup, PlayerHit, BossDamaged
+from .viewport import ACTIVE_BAND
+from . import framestats
+from . import masks
 
 
 # ---------------------------------------------------------------------------
-#  Speed scaling table (shared by meteors, extra_score, black holes)
+#  Projectile hit tests (swept AABB)
 # ---------------------------------------------------------------------------
 
-_SPEED_TIERS = [
-    (20000, 10),
-    (15000, 8),
-    (10000, 6),
-    (3000,  4),
-]
+def swept_interval(rect, prev_pos, target):
+    """Fractions ``(t0, t1)`` of the last step during which *rect* overlapped *target*.
+
+    Slab test of the moving top-left corner against *target* grown by the
+    rect's size, with the same open-interval overlap as ``colliderect``;
+    None if the rect never overlapped it while moving from *prev_pos*.
+    """
+    t0, t1 = 0.0, 1.0
+    for p, d, lo, hi in ((prev_pos[0], rect.x - prev_pos[0], target.left - rect.width, target.right),
+                         (prev_pos[1], rect.y - prev_pos[1], target.top - rect.height, target.bottom)):
+        if d == 0:
+            if not lo < p < hi:
+                return None
+            continue
+        ta, tb = (lo - p) / d, (hi - p) / d
+        if ta > tb:
+            ta, tb = tb, ta
+        t0, t1 = max(t0, ta), min(t1, tb)
+        if t0 >= t1:
+            return None
+    return t0, t1
+
+
+def swept_hit(rect, prev_pos, target):
+    """True if *rect*, moving from *prev_pos* to where it is now, overlapped *target*."""
+    return swept_interval(rect, prev_pos, target) is not None
+
+
+def projectile_hit(projectile, target):
+    """Pixel-accurate hit anywhere along the projectile's last step.
+
+    The masks are compared at points of the step where the rects overlap,
+    both ends included and no further apart than the projectile's smaller
+    side, so a fast projectile cannot skip a target while a pass through
+    its transparent margin or a graze across its corner does not count.
+    The target is treated as standing still at its current position; it
+    has usually just moved, so the start of the step is tested again.
+    """
+    rect = projectile.rect
+    interval = swept_interval(rect, projectile.prev_pos, target.rect)
+    if interval is None:
+        return False
+    t0, t1 = interval
+    px, py = projectile.prev_pos
+    dx, dy = rect.x - px, rect.y - py
+    samples = 1 + int((t1 - t0) * max(abs(dx), abs(dy)) / max(1, min(rect.size)))
+    for i in range(samples + 1):
+        t = t0 + (t1 - t0) * i / samples
+        if masks.overlap(projectile.image, (round(px + dx * t), round(py + dy * t)),
+                         target.image, target.rect.topleft):
+            return True
+    return False
+
+
+def hit_by(target, projectile):
+    """``projectile_hit`` with arguments in ``spritecollide`` callback order."""
+    return projectile_hit(projectile, target)
 
 
-def _scale_speed(sprite, score):
-    """Set sprite.speed based on the current score."""
-    for threshold, spd in _SPEED_TIERS:
-        if score >= threshold:
-            sprite.speed = spd
-            return
+def swept_bounds(projectile):
+    """Rect covering a projectile's whole last step (bullet grid broadphase)."""
+    return projectile.rect.union(pygame.Rect(projectile.prev_pos, projectile.rect.size))
+
+
+def _active(sprites):
+    """Sprites inside the activation band (a new list, safe to kill from)."""
+    inside = ACTIVE_BAND.colliderect
+    active = [sprite for sprite in sprites if inside(sprite.rect)]
+    framestats.add('tests', len(active))
+    framestats.add('tests_culled', len(sprites) - len(active))
+    return active
 
 
 # ---------------------------------------------------------------------------
 #  Refill / pickup processing
 # ---------------------------------------------------------------------------
 
-def process_refills(groups, player, score):
-    """Update all refills & check collisions; return (life_delta, ammo_delta, score_delta)."""
-    life_d = ammo_d = score_d = 0
+def process_refills(groups, player):
+    """Update all refills & emit a Pickup for each one the player touches."""
+    emit = groups.events.emit
+    active = ACTIVE_BAND.colliderect
+    tested = culled = 0
 
     for group in (groups.bullet_refill, groups.health_refill,
                   groups.double_refill, groups.extra_score):
         for sprite in group:
             sprite.update()
 
-            if player.rect.colliderect(sprite.rect):
-                if sprite.health_restore and life_d + 200 > 0:
-                    life_d += sprite.health_restore
-                if sprite.ammo_restore and ammo_d + 200 > 0:
-                    ammo_d += sprite.ammo_restore
-                score_d += sprite.score_bonus
-                sprite.sound_effect.play()
+            if not active(sprite.rect):
+                culled += 1
+            elif player.rect.colliderect(sprite.rect):
+                emit(Pickup(sprite))
                 sprite.kill()
+            tested += 1
 
-            # extra_score and similar hazards speed up with score
-            _scale_speed(sprite, score)
-
-    return life_d, ammo_d, score_d
+    framestats.add('tests', tested - culled)
+    framestats.add('tests_culled', culled)
 
 
 # ---------------------------------------------------------------------------
 #  Black holes
 # ---------------------------------------------------------------------------
 
-def process_black_holes(groups, player, score):
-    """Update black holes & check collisions; return life_delta."""
-    life_d = 0
+def process_black_holes(groups, player):
+    """Update black holes & emit a PlayerHit per hole touching the player."""
     for obj in groups.black_holes:
         obj.update()
-        if obj.rect.colliderect(player.rect):
-            life_d -= 1
-            obj.sound_effect.play()
-        _scale_speed(obj, score)
-    return life_d
+    for obj in _active(groups.black_holes):
+        if masks.collide(obj, player):
+            groups.events.emit(PlayerHit('black_hole', obj, 1, player.rect.center))
 
 
 # ---------------------------------------------------------------------------
-#  Meteors (type 1 & 2) — generic hazard with bullet-killable sprites
+#  Shootable enemies and hazards
 # ---------------------------------------------------------------------------
 
-def process_hazard_group(group, groups, player, assets, score):
-    """Update & handle collisions for a meteor/hazard group.
+def _fight(kind, sprites, groups, player):
+    """Contact and player-bullet hits for *sprites*; each one dies on either.
 
-    Each sprite in *group* must have class attrs:
-        contact_damage, score_on_contact, score_on_kill, drop_chance
-    Returns (life_delta, score_delta).
+    Each sprite must have class attrs ``contact_damage`` (and, for the
+    scoring and drop consumers, ``score_on_contact``, ``score_on_kill`` and
+    the drop chances listed in ``consumers.DROPS``).
     """
-    life_d = score_d = 0
-    expl_imgs = assets.explosions['explosion1']
-    drop_img = assets.refills['double']
-
-    for obj in list(group):
-        obj.update()
-
-        # player collision → damage + explosion + kill
-        if obj.rect.colliderect(player.rect):
-            life_d -= obj.contact_damage
-            groups.explosions.add(Explosion(obj.rect.center, expl_imgs))
+    emit = groups.events.emit
+    collide = groups.bullet_grid.collide
+    for obj in sprites:
+        if masks.collide(obj, player):
+            emit(PlayerHit(kind, obj, obj.contact_damage, player.rect.center))
+            emit(Kill(kind, obj, obj.rect.center, 'contact'))
             obj.kill()
-            score_d += obj.score_on_contact
-            continue
-
-        # bullet collision → explosion + kill + optional drop
-        hits = pygame.sprite.spritecollide(obj, groups.bullets, True)
-        for _ in hits:
-            groups.explosions.add(Explosion(obj.rect.center, expl_imgs))
+        elif collide(obj, True, hit_by):
+            emit(Kill(kind, obj, obj.rect.center, 'bullet'))
             obj.kill()
-            score_d += obj.score_on_kill
-            if random.randint(0, obj.drop_chance) == 0:
-                groups.double_refill.add(DoubleRefill(
-                    obj.rect.centerx, obj.rect.centery, drop_img))
-            break  # sprite is dead after first hit
-
-        _scale_speed(obj, score)
-
-    return life_d, score_d
 
 
-# ---------------------------------------------------------------------------
-#  Enemy1 — bouncing enemies (same pattern as hazards but different update)
-# ---------------------------------------------------------------------------
-
-def process_enemy1(groups, player, assets):
-    """Update & process collisions for Enemy1 group.
-
-    Returns (life_delta, score_delta).
-    """
-    life_d = score_d = 0
-    expl_imgs = assets.explosions['explosion1']
-    bullet_img = assets.refills['bullet']
-    health_img = assets.refills['health']
+def process_hazard_group(group, groups, player):
+    """Update & handle collisions for a meteor/hazard group."""
+    for obj in list(group):
+        obj.update()
+    _fight('meteor', _active(group), groups, player)
 
-    for obj in list(groups.enemy1):
-        obj.update(groups.enemy1)
 
+def process_enemy1(groups, player):
+    """Update & process collisions for the Enemy1 group."""
     for obj in list(groups.enemy1):
-        if obj.rect.colliderect(player.rect):
-            life_d -= obj.contact_damage
-            groups.explosions.add(Explosion(obj.rect.center, expl_imgs))
-            obj.kill()
-            score_d += obj.score_on_contact
-            continue
-
-        hits = pygame.sprite.spritecollide(obj, groups.bullets, True)
-        for _ in hits:
-            groups.explosions.add(Explosion(obj.rect.center, expl_imgs))
-            obj.kill()
-            score_d += obj.score_on_kill
-
-            if random.randint(0, obj.drop_chance_bullet) == 0:
-                groups.bullet_refill.add(BulletRefill(
-                    obj.rect.centerx, obj.rect.centery, bullet_img))
-            if random.randint(0, obj.drop_chance_health) == 0:
-                groups.health_refill.add(HealthRefill(
-                    random.randint(50, WIDTH - 30),
-                    random.randint(-HEIGHT, -30),
-                    health_img))
-            break
-
-    return life_d, score_d
-
-
-# ---------------------------------------------------------------------------
-#  Enemy2 — shooting enemy
-# ---------------------------------------------------------------------------
-
-def process_enemy2(groups, player, assets):
-    """Update enemy2 + their bullets, handle collisions.
+        obj.update()
+    separate(groups.enemy1)
+    _fight('enemy1', _active(groups.enemy1), groups, player)
 
-    Returns (life_delta, score_delta).
-    """
-    life_d = score_d = 0
-    expl_imgs = assets.explosions['explosion2']
-    expl3_imgs = assets.explosions['explosion3']
-    drop_img = assets.refills['double']
 
+def process_enemy2(groups, player):
+    """Update enemy2 + their bullets, handle collisions."""
     for obj in list(groups.enemy2):
-        obj.update(groups.enemy2, groups.enemy2_bullets, player)
+        obj.update(groups.enemy2_bullets, player)
+    separate(groups.enemy2)
 
     groups.enemy2_bullets.update()
 
-    for obj in list(groups.enemy2):
-        if obj.rect.colliderect(player.rect):
-            life_d -= obj.contact_damage
-            groups.explosions2.add(Explosion2(obj.rect.center, expl_imgs))
-            obj.kill()
-            score_d += obj.score_on_contact
-            continue
-
-        hits = pygame.sprite.spritecollide(obj, groups.bullets, True)
-        for _ in hits:
-            groups.explosions2.add(Explosion2(obj.rect.center, expl_imgs))
-            obj.kill()
-            score_d += obj.score_on_kill
-            if random.randint(0, obj.drop_chance) == 0:
-                groups.double_refill.add(DoubleRefill(
-                    obj.rect.centerx, obj.rect.centery, drop_img))
-            break
+    _fight('enemy2', _active(groups.enemy2), groups, player)
 
     # enemy bullets hitting player
-    for bullet in list(groups.enemy2_bullets):
-        if bullet.rect.colliderect(player.rect):
-            life_d -= 10  # Enemy2.bullet_damage
-            groups.explosions.add(Explosion(player.rect.center, expl3_imgs))
+    for bullet in _active(groups.enemy2_bullets):
+        if projectile_hit(bullet, player):
+            groups.events.emit(PlayerHit('enemy2_bullet', bullet, bullet.damage,
+                                         player.rect.center))
             bullet.kill()
 
-    return life_d, score_d
-
 
 # ---------------------------------------------------------------------------
 #  Boss (generic for boss index 0/1/2)
 # ---------------------------------------------------------------------------
 
-def process_boss(idx, groups, player, assets):
-    """Update boss[idx] + their bullets, handle collisions.
-
-    Returns (life_delta, score_delta).
-    """
+def process_boss(idx, groups, player):
+    """Update boss[idx] (which fires into ``groups.boss_field``), handle collisions."""
     boss_group = groups.boss[idx]
-    bullet_group = groups.boss_bullets[idx]
-    bstate = groups.boss_state
-    life_d = score_d = 0
-
     if not boss_group:
-        return life_d, score_d
-
-    expl_imgs = assets.explosions['explosion2']
-    expl3_imgs = assets.explosions['explosion3']
-    drop_img = assets.refills['double']
+        return
+    bstate = groups.boss_state
+    emit = groups.events.emit
 
     for obj in list(boss_group):
-        obj.update(bullet_group, player)
-
-    bullet_group.update()
+        obj.update(groups.boss_field, player)
 
-    for obj in list(boss_group):
+    for obj in _active(boss_group):
         # contact damage (doesn't kill the boss)
-        if obj.rect.colliderect(player.rect):
-            life_d -= obj.contact_damage
-            groups.explosions2.add(Explosion2(obj.rect.center, expl_imgs))
+        if masks.collide(obj, player):
+            emit(PlayerHit('boss', obj, obj.contact_damage, obj.rect.center))
 
         # player bullets hitting boss
-        hits = pygame.sprite.spritecollide(obj, groups.bullets, True)
+        hits = groups.bullet_grid.collide(obj, True, hit_by)
         for _ in hits:
-            groups.explosions2.add(Explosion2(obj.rect.center, expl_imgs))
             bstate.health[idx] -= obj.hp_per_bullet
+            emit(BossDamaged(idx, obj, obj.hp_per_bullet, obj.rect.center))
 
             if bstate.health[idx] <= 0:
-                groups.explosions.add(Explosion(obj.rect.center, expl3_imgs))
+                emit(Kill('boss', obj, obj.rect.center, 'bullet'))
                 obj.kill()
-                score_d += obj.score_on_kill
-                if random.randint(0, obj.drop_chance) == 0:
-                    groups.double_refill.add(DoubleRefill(
-                        obj.rect.centerx, obj.rect.centery, drop_img))
                 break
 
         # boss cleanup when health reaches zero outside bullet loop
         if bstate.health[idx] <= 0 and obj.alive():
-            groups.explosions2.add(Explosion2(obj.rect.center, expl_imgs))
+            emit(Kill('boss', obj, obj.rect.center, 'cleanup'))
             obj.kill()
 
-    # boss bullets hitting player
-    for bullet in list(bullet_group):
-        if bullet.rect.colliderect(player.rect):
-            # Use the boss class bullet_damage (get from first sprite or use stored ref)
-            life_d -= 20  # all bosses currently deal 20 bullet damage
-            groups.explosions.add(Explosion(player.rect.center, expl3_imgs))
-            bullet.kill()
 
-    return life_d, score_d
+def process_boss_bullets(groups, player):
+    """Move every boss bullet and hit-test them against the player.
+
+    Runs every frame, bosses alive or not.
+    """
+    field = groups.boss_field
+    field.update()
+    for damage in field.collide(player.image, player.rect):
+        groups.events.emit(PlayerHit('boss_bullet', field, damage,
+                                     player.rect.center))
@@ -4,6 +4,12 @@ HEIGHT = 800
 ENEMY_FORCE = 4
 SHOOT_DELAY = 150
 FPS = 60
+ASSET_MEMORY_BUDGET = 24 * 1024 * 1024   # bytes of decoded images (store, rotation frames, render-scale copies)
+RENDER_SCALE = 1.0  # internal render resolution relative to the window (0.5, 0.75, 1)
+ACTIVE_MARGIN = 64   # px around the view where entities are drawn/hit-tested
+PIXEL_COLLISIONS = True   # mask test after a rect overlap (False: rects only)
+ROTATION_STEP = 4   # degrees between cached frames of spinning hazards
+ANIMATION_FRAME_TICKS = 4   # simulated frames each explosion image is shown
 WHITE = (154, 164, 166)
 BLACK = (0, 0, 0)
 RED = (255, 0, 0)
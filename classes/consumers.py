@@ -0,0 +1,158 @@
+"""Standard consumers of the gameplay event bus (see events.py).
+
+Each runs once per frame over the whole event buffer:
+
+* :class:`Effects` — explosions, at most one per effect and spot per frame
+  (a boss hit by three bullets at once shows one blast, not three stacked)
+  and at most ``MAX_EFFECTS`` new ones per frame;
+* :class:`Drops` — pickups rolled for kills by player bullets;
+* :func:`play_sounds` — pickup and black-hole sounds, each sound once per
+  frame;
+* :class:`Tally` — score, healing, ammo and damage for the game loop to
+  apply.
+"""
+import random
+
+from .constants import WIDTH, HEIGHT
+from .events import Kill, Pickup, PlayerHit, BossDamaged
+from .explosions import Explosion, Explosion2
+from .refill import BulletRefill, HealthRefill, DoubleRefill
+
+MAX_EFFECTS = 24   # new explosions per frame
+
+
+# ---------------------------------------------------------------------------
+#  Effects
+# ---------------------------------------------------------------------------
+
+# effect = (GameGroups attribute, explosion class, GameAssets.explosions key)
+_SMALL = ('explosions', Explosion, 'explosion1')
+_MEDIUM = ('explosions2', Explosion2, 'explosion2')
+_LARGE = ('explosions', Explosion, 'explosion3')
+
+# Kill kind -> effect ('cleanup' kills always use _MEDIUM)
+KILL_EFFECTS = {
+    'meteor': _SMALL,
+    'enemy1': _SMALL,
+    'enemy2': _MEDIUM,
+    'boss': _LARGE,
+}
+
+# PlayerHit kind -> effect; contact kills already show their Kill effect
+HIT_EFFECTS = {
+    'enemy2_bullet': _LARGE,
+    'boss_bullet': _LARGE,
+    'boss': _MEDIUM,
+}
+
+
+class Effects:
+    """Spawns the explosions for a frame's events."""
+
+    def __init__(self, groups, assets, limit=MAX_EFFECTS):
+        self.groups = groups
+        self.assets = assets
+        self.limit = limit
+
+    def __call__(self, events):
+        wanted = {}   # (effect, pos) -> None, in event order
+        for event in events:
+            kind = type(event)
+            if kind is Kill:
+                effect = _MEDIUM if event.cause == 'cleanup' else KILL_EFFECTS.get(event.kind)
+            elif kind is PlayerHit:
+                effect = HIT_EFFECTS.get(event.kind)
+            elif kind is BossDamaged:
+                effect = _MEDIUM
+            else:
+                continue
+            if effect is not None:
+                wanted[(effect, event.pos)] = None
+        for (attr, cls, key), pos in list(wanted)[:self.limit]:
+            getattr(self.groups, attr).add(cls(pos, self.assets.explosions[key]))
+
+
+# ---------------------------------------------------------------------------
+#  Drops
+# ---------------------------------------------------------------------------
+
+# Kill kind -> drops rolled when a player bullet kills it:
+#   (1-in-N class attribute, GameGroups attribute, refill class,
+#    GameAssets.refills key, spawn above the screen instead of at the kill)
+DROPS = {
+    'meteor': (('drop_chance', 'double_refill', DoubleRefill, 'double', False),),
+    'enemy1': (('drop_chance_bullet', 'bullet_refill', BulletRefill, 'bullet', False),
+               ('drop_chance_health', 'health_refill', HealthRefill, 'health', True)),
+    'enemy2': (('drop_chance', 'double_refill', DoubleRefill, 'double', False),),
+    'boss': (('drop_chance', 'double_refill', DoubleRefill, 'double', False),),
+}
+
+
+class Drops:
+    """Rolls and spawns pickups for kills by player bullets."""
+
+    def __init__(self, groups, assets):
+        self.groups = groups
+        self.assets = assets
+
+    def __call__(self, events):
+        for event in events:
+            if type(event) is not Kill or event.cause != 'bullet':
+                continue
+            for chance, attr, cls, key, above in DROPS.get(event.kind, ()):
+                if random.randint(0, getattr(event.victim, chance)) == 0:
+                    if above:
+                        x, y = random.randint(50, WIDTH - 30), random.randint(-HEIGHT, -30)
+                    else:
+                        x, y = event.pos
+                    getattr(self.groups, attr).add(cls(x, y, self.assets.refills[key]))
+
+
+# ---------------------------------------------------------------------------
+#  Sounds
+# ---------------------------------------------------------------------------
+
+def play_sounds(events):
+    """Play pickup and black-hole sounds, each distinct sound once."""
+    sounds = {}
+    for event in events:
+        kind = type(event)
+        if kind is Pickup:
+            sounds[event.item.sound_effect] = None
+        elif kind is PlayerHit and event.kind == 'black_hole':
+            sounds[event.source.sound_effect] = None
+    for sound in sounds:
+        sound.play()
+
+
+# ---------------------------------------------------------------------------
+#  Scoring
+# ---------------------------------------------------------------------------
+
+class Tally:
+    """Score and player resource changes from a frame's events.
+
+    The game loop applies and then :meth:`reset`\\ s it after each flush.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.score = self.heal = self.ammo = self.damage = 0
+
+    def __call__(self, events):
+        for event in events:
+            kind = type(event)
+            if kind is Kill:
+                if event.cause == 'bullet':
+                    self.score += event.victim.score_on_kill
+                elif event.cause == 'contact':
+                    self.score += event.victim.score_on_contact
+            elif kind is PlayerHit:
+                self.damage += event.damage
+            elif kind is Pickup:
+                item = event.item
+                self.heal += item.health_restore
+                self.ammo += item.ammo_restore
+                self.score += item.score_bonus
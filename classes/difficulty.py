@@ -0,0 +1,75 @@
+"""Difficulty curve — score tiers and everything that changes with them.
+
+:data:`TIERS` is the curve as data: from each tier's starting score on,
+the speed of meteors, black holes and pickups, the background and its
+scroll speed and the boss that enters.  Spawn rates per tier live in the
+wave table (see spawner.py).  The :class:`Difficulty` engine only looks
+the tier up when the score changed, and only touches live entities when
+the tier itself changed: the speed groups get their new speed once and
+pass it on to every sprite added later, so nothing re-checks the score
+per sprite or per frame.
+"""
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Optional
+
+# GameGroups attributes whose sprites move at the tier's hazard speed
+SPEED_GROUPS = ('bullet_refill', 'health_refill', 'double_refill', 'extra_score',
+                'black_holes', 'meteors', 'meteors2')
+
+
+@dataclass(frozen=True)
+class Tier:
+    score: int                         # tier starts at this score
+    hazard_speed: Optional[int]        # None: each class's own speed
+    background: int                    # index into the background images
+    scroll: int                        # background px per frame
+    boss: Optional[int] = None         # boss index entering at this tier
+
+
+TIERS = (
+    Tier(0, None, background=0, scroll=1),
+    Tier(1000, None, background=0, scroll=1),   # black holes (wave table)
+    Tier(3000, 4, background=1, scroll=2),
+    Tier(5000, 4, background=1, scroll=2, boss=0),
+    Tier(10000, 6, background=2, scroll=2, boss=1),
+    Tier(15000, 8, background=3, scroll=2, boss=2),
+    Tier(20000, 10, background=3, scroll=2),
+)
+
+
+class Difficulty:
+    """Tracks the tier for the current score and applies tier changes."""
+
+    def __init__(self, groups, tiers=TIERS):
+        self.groups = groups
+        self.tiers = tiers
+        self._starts = [tier.score for tier in tiers]
+        self.reset()
+
+    def update(self, score):
+        """Follow *score*; returns True when the tier changed.  Call once per frame."""
+        if score == self._score:
+            return False
+        self._score = score
+        index = max(0, bisect_right(self._starts, score) - 1)
+        if index == self.index:
+            return False
+        self._enter(index)
+        return True
+
+    def _enter(self, index):
+        self.index = index
+        self.tier = self.tiers[index]
+        for name in SPEED_GROUPS:
+            getattr(self.groups, name).set_speed(self.tier.hazard_speed)
+
+    def bosses_due(self):
+        """Boss indices that enter at or before the current tier."""
+        return [tier.boss for tier in self.tiers[:self.index + 1] if tier.boss is not None]
+
+    def reset(self):
+        """Forget the score; the next :meth:`update` enters a tier."""
+        self.index = -1
+        self.tier = None
+        self._score = None
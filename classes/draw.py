@@ -1,10 +1,15 @@
 """Drawing / rendering — all visual output lives here, no game logic."""
 from dataclasses import dataclass, field
-from typing import List
+from typing import Sequence
 
 import pygame
 
 from .constants import WIDTH, HEIGHT
+from . import atlas
+from . import fonts
+from . import surfaces
+from .viewport import Viewport, VIEW_RECT
+from . import framestats
 
 
 # ---------------------------------------------------------------------------
@@ -15,46 +20,41 @@ from .constants import WIDTH, HEIGHT
 class BackgroundState:
     """Encapsulates scrolling-background state (images, position, tier)."""
 
-    images: List[pygame.Surface] = field(repr=False)
+    images: Sequence[pygame.Surface] = field(repr=False)
     y: int = 0
     current: pygame.Surface = field(default=None, repr=False)
-    upgraded: bool = False
+    tier: object = field(default=None, repr=False)
 
     # -- factory --
 
     @classmethod
-    def create(cls, images: List[pygame.Surface]) -> "BackgroundState":
-        """Build an initial state from the four background images."""
+    def create(cls, images: Sequence[pygame.Surface]) -> "BackgroundState":
+        """Build an initial state from the four background images.
+
+        *images* may be a lazy view (``SlotView``); tiers are only fetched
+        once the score reaches them.
+        """
         return cls(
             images=images,
             y=-HEIGHT,
             current=images[0],
-            upgraded=False,
         )
 
-    # -- logic: scroll position & tier selection (score-driven) --
+    # -- logic: scroll position & image, from the difficulty tier --
 
-    def update(self, score: int) -> None:
-        """Advance scroll position and pick the current background tier."""
-        self.y += 2 if score > 3000 else 1
+    def update(self, tier) -> None:
+        """Advance the scroll position; switch image when *tier* changed."""
+        self.y += tier.scroll
         if self.y >= 0:
             self.y = -HEIGHT
-
-        if score >= 15000:
-            self.current = self.images[3]
-        elif score >= 10000:
-            self.current = self.images[2]
-        elif score >= 3000 and not self.upgraded:
-            self.current = self.images[1]
-            self.upgraded = True
-        elif score == 0:
-            self.current = self.images[0]
-            self.upgraded = False
+        if tier is not self.tier:
+            self.tier = tier
+            self.current = self.images[tier.background]
 
     def reset(self) -> None:
         """Reset to the initial background (used on game-over)."""
         self.current = self.images[0]
-        self.upgraded = False
+        self.tier = None
         self.y = -HEIGHT
 
 
@@ -62,16 +62,16 @@ class BackgroundState:
 #  Individual draw helpers
 # ---------------------------------------------------------------------------
 
-def draw_background(screen: pygame.Surface, bg: BackgroundState) -> None:
+def draw_background(view: Viewport, bg: BackgroundState) -> None:
     """Blit the tiled scrolling background."""
-    screen.blit(bg.current, (0, bg.y))
-    top = bg.current.copy()
-    screen.blit(top, top.get_rect(topleft=(0, bg.y + HEIGHT)))
+    image = view.image(bg.current)
+    view.surface.blit(image, view.point(0, bg.y))
+    view.surface.blit(image, view.point(0, bg.y + HEIGHT))
 
 
 def draw_pause(screen: pygame.Surface) -> None:
     """Render the PAUSE overlay text."""
-    font = pygame.font.SysFont("Comic Sans MS", 40)
+    font = fonts.get_font("Comic Sans MS", 40)
     text = font.render("PAUSE", True, (255, 255, 255))
     screen.blit(text, text.get_rect(center=(WIDTH // 2, HEIGHT // 2)))
 
@@ -80,73 +80,101 @@ def draw_pause(screen: pygame.Surface) -> None:
 #  Full game-world renderer
 # ---------------------------------------------------------------------------
 
-def draw_game_world(screen, groups, player) -> int:
-    """Draw every game entity onto *screen* and return bullets-consumed count.
+def _check_formats(groups, player) -> None:
+    """Report any sprite surface about to be blitted in non-display format."""
+    for grp in groups._all_groups():
+        surfaces.check_sprites(grp, "sprite")
+    surfaces.check_blit(player.image, "player")
 
-    The returned ``ammo_consumed`` is the number of player bullets that flew
-    off the top of the screen this frame (must be subtracted from the ammo
-    counter by the caller).
+
+def draw_sprites(view: Viewport, sprites) -> None:
+    """Blit *sprites* in one batched call.
+
+    Atlas sprites are blitted straight from their page, so consecutive
+    sprites share a source surface.  Below render scale 1 the scaled
+    variants are drawn at scaled positions.  Sprites entirely outside the
+    view are skipped.
+    """
+    items = []
+    visible = VIEW_RECT.colliderect
+    total = 0
+    if view.scale == 1:
+        source = atlas.source
+        for sprite in sprites:
+            total += 1
+            if visible(sprite.rect):
+                image, area = source(sprite.image)
+                items.append((image, sprite.rect, area))
+    else:
+        source = view.source
+        s = view.scale
+        for sprite in sprites:
+            total += 1
+            rect = sprite.rect
+            if visible(rect):
+                image, area = source(sprite.image)
+                items.append((image, (round(rect.x * s), round(rect.y * s)), area))
+    view.surface.blits(items, doreturn=False)
+    framestats.add('blits', len(items))
+    framestats.add('blits_culled', total - len(items))
+
+
+def draw_game_world(view, groups, player) -> None:
+    """Draw every game entity into *view*.
+
+    Player bullets are moved by ``groups.world.step()`` and explosions by
+    ``animation.step`` before this is called.
 
     Draw order (bottom → top):
         refills → black holes → meteors → enemy1 → enemy2 + bullets →
-        bosses + bullets + health bars → player → explosions → player bullets
+        boss bullets → bosses + health bars → player → explosions → player bullets
     """
+    if surfaces.CHECK_FORMATS:
+        _check_formats(groups, player)
+
     # --- refills / pickups ---
     for grp in (groups.bullet_refill, groups.health_refill,
                 groups.double_refill, groups.extra_score):
-        grp.draw(screen)
+        draw_sprites(view, grp)
 
     # --- black holes ---
-    groups.black_holes.draw(screen)
+    draw_sprites(view, groups.black_holes)
 
     # --- meteors ---
-    groups.meteors.draw(screen)
-    groups.meteors2.draw(screen)
+    draw_sprites(view, groups.meteors)
+    draw_sprites(view, groups.meteors2)
 
     # --- enemy1 ---
-    groups.enemy1.draw(screen)
+    draw_sprites(view, groups.enemy1)
 
     # --- enemy2 + enemy bullets ---
-    groups.enemy2.draw(screen)
-    groups.enemy2_bullets.draw(screen)
+    draw_sprites(view, groups.enemy2)
+    draw_sprites(view, groups.enemy2_bullets)
 
-    # --- bosses + boss bullets + health bars ---
+    # --- boss bullets + bosses + health bars ---
+    groups.boss_field.draw(view)
     bstate = groups.boss_state
     for i in range(3):
         boss_grp = groups.boss[i]
-        groups.boss_bullets[i].draw(screen)
-        boss_grp.draw(screen)
+        draw_sprites(view, boss_grp)
 
         if boss_grp:
             obj = boss_grp.sprites()[0]
             bar = bstate.bar_rects[i]
             bar.center = (obj.rect.centerx, obj.rect.top - 5)
-            pygame.draw.rect(screen, (255, 0, 0), bar)
+            pygame.draw.rect(view.surface, (255, 0, 0), view.rect(bar))
             pygame.draw.rect(
-                screen,
+                view.surface,
                 (0, 255, 0),
-                (bar.left, bar.top, max(0, bstate.health[i]), bar.height),
+                view.rect((bar.left, bar.top, max(0, bstate.health[i]), bar.height)),
             )
 
     # --- player ---
-    screen.blit(player.image.copy(), player.rect)
+    draw_sprites(view, (player,))
 
     # --- explosions ---
-    for expl in groups.explosions:
-        expl.update()
-        screen.blit(expl.image, expl.rect)
-
-    for expl in groups.explosions2:
-        expl.update()
-        screen.blit(expl.image, expl.rect)
+    draw_sprites(view, groups.explosions)
+    draw_sprites(view, groups.explosions2)
 
     # --- player bullets ---
-    ammo_consumed = 0
-    for bullet in groups.bullets:
-        bullet.update()
-        screen.blit(bullet.image, bullet.rect)
-        if bullet.rect.bottom < 0:
-            bullet.kill()
-            ammo_consumed += 1
-
-    return ammo_consumed
+    draw_sprites(view, groups.bullets)
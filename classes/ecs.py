@@ -0,0 +1,254 @@
+"""Small entity-component-system core.
+
+Entities are integer ids.  Each component type lives in its own
+:class:`Store`, a sparse set that packs the ``__slots__`` component objects
+densely so systems run tight loops over plain lists instead of walking
+sprite groups and per-instance dicts.  Systems are plain functions over a
+:class:`World`; :meth:`World.step` runs them in order once per frame.
+
+Migration is gradual: an ECS entity can be given an :class:`Entity` proxy,
+a ``pygame.sprite.Sprite`` whose ``image``/``prev_pos`` read the components
+and whose ``rect`` is the Collider's own Rect, held in a slot.  Proxies live in the usual GameGroups groups, so the
+``process_*`` collision functions, the bullet grid, the lifetime policy and
+the renderer keep working unchanged.  Killing a proxy or removing it from
+its last group destroys the entity, and destroying the entity kills the
+proxy.
+"""
+import pygame
+
+
+# ---------------------------------------------------------------------------
+#  Components
+# ---------------------------------------------------------------------------
+
+class Position:
+    """World-space top-left corner, plus where it was before the last move."""
+    __slots__ = ('x', 'y', 'prev_x', 'prev_y')
+
+    def __init__(self, x, y):
+        self.x = self.prev_x = x
+        self.y = self.prev_y = y
+
+
+class Velocity:
+    """Displacement per tick."""
+    __slots__ = ('dx', 'dy')
+
+    def __init__(self, dx, dy):
+        self.dx = dx
+        self.dy = dy
+
+
+class Image:
+    """Surface to draw."""
+    __slots__ = ('image',)
+
+    def __init__(self, image):
+        self.image = image
+
+
+class Collider:
+    """Axis-aligned box, kept at the entity's Position by the movement system."""
+    __slots__ = ('rect',)
+
+    def __init__(self, rect):
+        self.rect = rect
+
+
+class Lifetime:
+    """Age in ticks, and the limits past which the entity is destroyed.
+
+    *max_age* None means no age limit; *top*/*bottom* are world y limits for
+    the collider (leaving above *top* or below *bottom* destroys it).
+    """
+    __slots__ = ('age', 'max_age', 'top', 'bottom')
+
+    def __init__(self, max_age=None, top=None, bottom=None):
+        self.age = 0
+        self.max_age = max_age
+        self.top = top
+        self.bottom = bottom
+
+
+COMPONENTS = (Position, Velocity, Image, Collider, Lifetime)
+
+
+# ---------------------------------------------------------------------------
+#  Storage
+# ---------------------------------------------------------------------------
+
+class Store:
+    """Sparse set of one component type: dense component list + entity ids."""
+    __slots__ = ('items', 'entities', '_index')
+
+    def __init__(self):
+        self.items = []      # components, densely packed
+        self.entities = []   # entity id of each item
+        self._index = {}     # entity id -> position in items
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, eid):
+        return eid in self._index
+
+    def get(self, eid):
+        return self.items[self._index[eid]]
+
+    def add(self, eid, component):
+        self._index[eid] = len(self.items)
+        self.items.append(component)
+        self.entities.append(eid)
+
+    def remove(self, eid):
+        """Drop *eid*'s component by moving the last one into its slot."""
+        i = self._index.pop(eid, None)
+        if i is None:
+            return
+        last_item = self.items.pop()
+        last_eid = self.entities.pop()
+        if i < len(self.items):
+            self.items[i] = last_item
+            self.entities[i] = last_eid
+            self._index[last_eid] = i
+
+    def clear(self):
+        self.items.clear()
+        self.entities.clear()
+        self._index.clear()
+
+
+class World:
+    """Entities, their component stores and the per-frame systems."""
+
+    def __init__(self, systems=None):
+        self.stores = {cls: Store() for cls in COMPONENTS}
+        self.systems = list(systems) if systems is not None else list(DEFAULT_SYSTEMS)
+        self.proxies = {}    # entity id -> Entity
+        self._next_id = 0
+        self._alive = set()
+
+    def __len__(self):
+        return len(self._alive)
+
+    def store(self, cls):
+        return self.stores[cls]
+
+    def spawn(self, *components):
+        """Create an entity with *components*; returns its id."""
+        eid = self._next_id
+        self._next_id += 1
+        self._alive.add(eid)
+        for component in components:
+            self.stores[type(component)].add(eid, component)
+        return eid
+
+    def destroy(self, eid):
+        """Remove *eid* and all its components (idempotent); kills its proxy."""
+        if eid not in self._alive:
+            return
+        self._alive.discard(eid)
+        for store in self.stores.values():
+            store.remove(eid)
+        proxy = self.proxies.pop(eid, None)
+        if proxy is not None and proxy.alive():
+            proxy.kill()
+
+    def alive(self, eid):
+        return eid in self._alive
+
+    def clear(self):
+        for eid in list(self._alive):
+            self.destroy(eid)
+
+    def step(self):
+        """Run every system once."""
+        for system in self.systems:
+            system(self)
+
+
+# ---------------------------------------------------------------------------
+#  Systems
+# ---------------------------------------------------------------------------
+
+def movement_system(world):
+    """Position += Velocity; colliders follow their position."""
+    positions = world.stores[Position]
+    velocities = world.stores[Velocity]
+    colliders = world.stores[Collider]
+    get_position = positions.get
+    for eid, vel in zip(velocities.entities, velocities.items):
+        pos = get_position(eid)
+        pos.prev_x = pos.x
+        pos.prev_y = pos.y
+        pos.x += vel.dx
+        pos.y += vel.dy
+    for eid, col in zip(colliders.entities, colliders.items):
+        if eid in positions:
+            pos = get_position(eid)
+            col.rect.topleft = (int(pos.x), int(pos.y))
+
+
+def lifetime_system(world):
+    """Age entities and destroy those past their age or y limits."""
+    colliders = world.stores[Collider]
+    lifetimes = world.stores[Lifetime]
+    expired = []
+    for eid, life in zip(lifetimes.entities, lifetimes.items):
+        life.age += 1
+        if life.max_age is not None and life.age > life.max_age:
+            expired.append(eid)
+            continue
+        if eid in colliders:
+            rect = colliders.get(eid).rect
+            if (life.top is not None and rect.top <= life.top) or \
+                    (life.bottom is not None and rect.top > life.bottom):
+                expired.append(eid)
+    for eid in expired:
+        world.destroy(eid)
+
+
+DEFAULT_SYSTEMS = (movement_system, lifetime_system)
+
+
+# ---------------------------------------------------------------------------
+#  Sprite compatibility
+# ---------------------------------------------------------------------------
+
+class Entity(pygame.sprite.Sprite):
+    """Sprite-protocol view of an ECS entity, for groups and the process_* API.
+
+    ``rect`` is the entity's Collider Rect itself (the movement system
+    updates it in place), kept in a slot because the bullet grid and the
+    hit tests read it for every projectile every frame.
+    """
+    __slots__ = ('rect',)
+
+    def __init__(self, world, eid, *groups):
+        super().__init__(*groups)
+        self.world = world
+        self.eid = eid
+        colliders = world.stores[Collider]
+        self.rect = colliders.get(eid).rect if eid in colliders else None
+        world.proxies[eid] = self
+
+    @property
+    def image(self):
+        return self.world.stores[Image].get(self.eid).image
+
+    @property
+    def prev_pos(self):
+        pos = self.world.stores[Position].get(self.eid)
+        return int(pos.prev_x), int(pos.prev_y)
+
+    def update(self, *args, **kwargs):
+        """Entities are advanced by World.step(), not by Group.update()."""
+
+    def kill(self):
+        super().kill()
+        self.world.destroy(self.eid)
+
+    def remove_internal(self, group):
+        super().remove_internal(group)
+        if not self.alive():
+            self.world.destroy(self.eid)
@@ -1,7 +1,9 @@
-"""Enemy sprite classes (non-boss)."""
-import pygame
+"""Enemy sprite classes (non-boss) and their group separation pass."""
+import math
 import random
 
+import pygame
+
 from .constants import WIDTH, HEIGHT, ENEMY_FORCE
 from .bullets import Enemy2Bullet
 
@@ -23,7 +25,10 @@ class Enemy1(pygame.sprite.Sprite):
         self.speed = 4
         self.direction = random.choice([(-1, -1), (-1, 1), (1, -1), (1, 1)])
 
-    def update(self, enemy_group):
+    # pushes overlapping enemies apart in separate()
+    repels = True
+
+    def update(self):
         dx, dy = self.direction
         self.rect.x += dx * self.speed
         self.rect.y += dy * self.speed
@@ -42,30 +47,6 @@ class Enemy1(pygame.sprite.Sprite):
             self.rect.bottom = HEIGHT - 5
             self.direction = random.choice([(1, 0), (-1, 0), (0, -1), (1, -1), (-1, -1)])
 
-        collided_with = pygame.sprite.spritecollide(self, enemy_group, False)
-        for other_enemy in collided_with:
-            if other_enemy != self:
-                distance_vec = pygame.math.Vector2(other_enemy.rect.center) - pygame.math.Vector2(self.rect.center)
-                distance = distance_vec.length()
-                angle = distance_vec.angle_to(pygame.math.Vector2(1, 0))
-
-                repel_vec = pygame.math.Vector2(1, 0).rotate(angle)
-                repel_vec *= (1 - (distance / (self.rect.width + other_enemy.rect.width)))
-                repel_vec *= ENEMY_FORCE
-
-                self_dir = pygame.math.Vector2(self.direction)
-                other_dir = pygame.math.Vector2(other_enemy.direction)
-
-                if distance != 0:
-                    new_dir = self_dir.reflect(distance_vec).normalize()
-                    other_new_dir = other_dir.reflect(-distance_vec).normalize()
-
-                    self.direction = new_dir.x, new_dir.y
-                    other_enemy.direction = other_new_dir.x, other_new_dir.y
-
-                self.rect.move_ip(-repel_vec.x, -repel_vec.y)
-                other_enemy.rect.move_ip(repel_vec.x, repel_vec.y)
-
 
 class Enemy2(pygame.sprite.Sprite):
     """Shooting enemy that charges at the player after exhausting ammo."""
@@ -86,7 +67,12 @@ class Enemy2(pygame.sprite.Sprite):
         self.shoot_timer = 0
         self.shots_fired = 0
 
-    def update(self, enemy_group, enemy_bullets_group, player):
+    @property
+    def repels(self):
+        """Only enemies still strafing push others away; chargers just get pushed."""
+        return self.shots_fired < 10
+
+    def update(self, enemy_bullets_group, player):
         if self.shots_fired < 10:
             dx, dy = self.direction
             self.rect.x += dx * self.speed
@@ -99,33 +85,9 @@ class Enemy2(pygame.sprite.Sprite):
                 self.rect.right = WIDTH - 5
                 self.direction = (-1, 0)
 
-            collided_with = pygame.sprite.spritecollide(self, enemy_group, False)
-            for other_enemy in collided_with:
-                if other_enemy != self:
-                    distance_vec = pygame.math.Vector2(other_enemy.rect.center) - pygame.math.Vector2(self.rect.center)
-                    distance = distance_vec.length()
-                    angle = distance_vec.angle_to(pygame.math.Vector2(1, 0))
-
-                    repel_vec = pygame.math.Vector2(1, 0).rotate(angle)
-                    repel_vec *= (1 - (distance / (self.rect.width + other_enemy.rect.width)))
-                    repel_vec *= ENEMY_FORCE
-
-                    self_dir = pygame.math.Vector2(self.direction)
-                    other_dir = pygame.math.Vector2(other_enemy.direction)
-
-                    if distance != 0:
-                        new_dir = self_dir.reflect(distance_vec).normalize()
-                        other_new_dir = other_dir.reflect(-distance_vec).normalize()
-
-                        self.direction = new_dir.x, new_dir.y
-                        other_enemy.direction = other_new_dir.x, other_new_dir.y
-
-                    self.rect.move_ip(-repel_vec.x, -repel_vec.y)
-                    other_enemy.rect.move_ip(repel_vec.x, repel_vec.y)
-
             self.shoot_timer += 1
             if self.shoot_timer >= 60:
-                bullet = Enemy2Bullet(self.rect.centerx, self.rect.bottom)
+                bullet = Enemy2Bullet(self.rect.centerx, self.rect.bottom, self.bullet_damage)
                 enemy_bullets_group.add(bullet)
                 self.shoot_timer = 0
                 self.shots_fired += 1
@@ -133,7 +95,63 @@ class Enemy2(pygame.sprite.Sprite):
             self.speed = 10
             dx = player.rect.centerx - self.rect.centerx
             dy = player.rect.centery - self.rect.centery
-            direction = pygame.math.Vector2(dx, dy).normalize()
+            direction = pygame.math.Vector2(dx, dy)
+            if direction:  # zero when centred on the player
+                direction.normalize_ip()
 
             self.rect.x += direction.x * self.speed
             self.rect.y += direction.y * self.speed
+
+
+# ---------------------------------------------------------------------------
+#  Mutual repulsion
+# ---------------------------------------------------------------------------
+
+def separate(enemies, force=ENEMY_FORCE):
+    """Push overlapping enemies apart and bounce their directions.
+
+    Sort-and-sweep on the x axis finds overlapping pairs; each pair is
+    resolved once per frame, if at least one of the two ``repels``.  Each
+    enemy is pushed along the line between centres, scaled by how deep
+    the overlap is, and its direction is reflected about that line.  The
+    push keeps the sign convention of the original per-sprite code, whose
+    vertical component was mirrored.
+    """
+    sprites = sorted(enemies, key=lambda e: e.rect.left)
+    rights = [e.rect.right for e in sprites]
+    lefts = [e.rect.left for e in sprites]
+    hypot = math.hypot
+    count = len(sprites)
+    for i in range(count):
+        a = sprites[i]
+        right = rights[i]
+        for j in range(i + 1, count):
+            if lefts[j] >= right:
+                break
+            b = sprites[j]
+            ra, rb = a.rect, b.rect
+            if not ra.colliderect(rb) or not (a.repels or b.repels):
+                continue
+            dx = rb.centerx - ra.centerx
+            dy = rb.centery - ra.centery
+            distance = hypot(dx, dy)
+            if distance:
+                ux, uy = dx / distance, dy / distance
+                a.direction = _reflect(a.direction, ux, uy)
+                b.direction = _reflect(b.direction, ux, uy)
+            else:
+                ux, uy = 1.0, 0.0
+            k = (1 - distance / (ra.width + rb.width)) * force
+            px, py = ux * k, -uy * k
+            ra.move_ip(-px, -py)
+            rb.move_ip(px, py)
+
+
+def _reflect(direction, ux, uy):
+    """Unit vector of *direction* reflected about the unit normal (ux, uy)."""
+    x, y = direction
+    dot = 2 * (x * ux + y * uy)
+    x -= dot * ux
+    y -= dot * uy
+    length = math.hypot(x, y)
+    return x / length, y / length
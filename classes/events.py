@@ -0,0 +1,79 @@
+"""Per-frame gameplay event bus.
+
+The ``process_*`` collision functions only decide *what happened* and
+:meth:`EventBus.emit` it as one of the typed events below.  Everything that
+reacts to it (explosions, sounds, drops, scoring, telemetry) is a consumer:
+a callable subscribed to the bus that receives the whole frame's buffer at
+once from :meth:`EventBus.flush`, so it can deduplicate, throttle or defer
+work, and instrumentation can subscribe without touching the hot loops.
+
+Events carry the ``kind`` of entity involved ('meteor', 'enemy1',
+'enemy2', 'boss', 'enemy2_bullet', 'boss_bullet', 'black_hole', 'pickup')
+and copy positions at emission time.  Sprites they reference may already
+be killed, but pooled ones are not reused before the end of the frame.
+"""
+from typing import NamedTuple, Tuple
+
+
+class Kill(NamedTuple):
+    """*victim* destroyed; *cause* is 'bullet', 'contact' or 'cleanup'."""
+    kind: str
+    victim: object
+    pos: Tuple[int, int]
+    cause: str
+
+
+class Pickup(NamedTuple):
+    """The player collected *item* (a refill or extra-score sprite)."""
+    item: object
+
+
+class PlayerHit(NamedTuple):
+    """The player took *damage* from *source*; *pos* is where it landed."""
+    kind: str
+    source: object
+    damage: int
+    pos: Tuple[int, int]
+
+
+class BossDamaged(NamedTuple):
+    """Boss *index* lost *damage* health to a player bullet."""
+    index: int
+    boss: object
+    damage: int
+    pos: Tuple[int, int]
+
+
+class EventBus:
+    """Buffer of this frame's events, and the consumers that drain it."""
+
+    def __init__(self):
+        self.events = []
+        self.consumers = []
+
+    def emit(self, event):
+        self.events.append(event)
+
+    def subscribe(self, consumer):
+        """Call *consumer(events)* on every flush; returns *consumer*.
+
+        The list passed in is reused after the call, so consumers must not
+        keep it.
+        """
+        self.consumers.append(consumer)
+        return consumer
+
+    def unsubscribe(self, consumer):
+        self.consumers.remove(consumer)
+
+    def flush(self):
+        """Hand the buffered events to every consumer, in order, then drop them."""
+        events = self.events
+        if not events:
+            return
+        for consumer in self.consumers:
+            consumer(events)
+        events.clear()
+
+    def clear(self):
+        self.events.clear()
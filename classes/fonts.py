@@ -0,0 +1,44 @@
+"""Font cache with background system-font discovery.
+
+``pygame.font.SysFont`` scans the installed fonts on first use, which can
+take a noticeable part of startup.  ``start_discovery()`` runs that scan on
+a worker thread right after display init; ``get_font()`` only waits for it
+when a named system font is actually needed, and caches every font so
+per-frame callers never construct one twice.  ``name=None`` is pygame's
+bundled default font and never needs the scan.
+"""
+import threading
+
+import pygame
+
+from . import profiler
+
+_cache = {}
+_discovery = None
+
+
+def _discover():
+    with profiler.trace("font discovery"):
+        pygame.font.get_fonts()
+
+
+def start_discovery():
+    """Start scanning system fonts in the background (idempotent)."""
+    global _discovery
+    if _discovery is None:
+        _discovery = threading.Thread(target=_discover, name="font-discovery", daemon=True)
+        _discovery.start()
+
+
+def get_font(name, size):
+    """Return a cached font; *name* None is the bundled default font."""
+    font = _cache.get((name, size))
+    if font is None:
+        if name is None:
+            font = pygame.font.Font(None, size)
+        else:
+            if _discovery is not None:
+                _discovery.join()
+            font = pygame.font.SysFont(name, size)
+        _cache[(name, size)] = font
+    return font
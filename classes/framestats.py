@@ -0,0 +1,54 @@
+"""Per-frame work counters — blits issued and hit tests run, how many were
+culled, how many entities the lifetime policy removed and how many
+gameplay events were emitted (:func:`count_events` is an event bus consumer).
+
+Counters are bumped once per sprite group, so keeping them costs next to
+nothing.  Set COSMIC_HEAT_FRAME_STATS=1 to print per-frame averages (and
+the object pool counters) every REPORT_EVERY frames.
+"""
+import os
+
+from . import pools
+
+ENABLED = bool(os.environ.get('COSMIC_HEAT_FRAME_STATS'))
+REPORT_EVERY = 300
+
+KEYS = ('blits', 'blits_culled', 'tests', 'tests_culled', 'expired', 'events')
+
+counts = dict.fromkeys(KEYS, 0)
+_frames = 0
+
+
+def add(key, n):
+    counts[key] += n
+
+
+def count_events(events):
+    counts['events'] += len(events)
+
+
+def reset():
+    global _frames
+    _frames = 0
+    for key in KEYS:
+        counts[key] = 0
+
+
+def averages():
+    """Per-frame averages since the last reset."""
+    return {key: counts[key] / max(1, _frames) for key in KEYS}
+
+
+def end_frame():
+    """Close the frame; prints and resets every REPORT_EVERY frames when enabled."""
+    global _frames
+    _frames += 1
+    if ENABLED and _frames >= REPORT_EVERY:
+        avg = averages()
+        print(f"frame stats (per frame): blits {avg['blits']:.1f} "
+              f"(+{avg['blits_culled']:.1f} culled), hit tests {avg['tests']:.1f} "
+              f"(+{avg['tests_culled']:.1f} culled), expired {avg['expired']:.2f}, "
+              f"events {avg['events']:.2f}")
+        if pools.report():
+            print(pools.report())
+        reset()
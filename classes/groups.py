@@ -3,6 +3,13 @@ from enum import Enum, auto
 
 import pygame
 
+from .difficulty import Difficulty
+from .ecs import World
+from .events import EventBus
+from .lifetime import LifetimeManager
+from .projectiles import ProjectileField
+from .spatial import SpatialHash
+
 
 class State(Enum):
     """Top-level game states."""
@@ -32,6 +39,24 @@ class BossState:
         ]
 
 
+class SpeedGroup(pygame.sprite.Group):
+    """Group that imposes its ``speed`` (when set) on every member."""
+
+    speed = None
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        if self.speed is not None:
+            sprite.speed = self.speed
+
+    def set_speed(self, speed):
+        """Set *speed* on every member now and on every sprite added later."""
+        self.speed = speed
+        if speed is not None:
+            for sprite in self.sprites():
+                sprite.speed = speed
+
+
 class GameGroups:
     """All sprite groups and boss state needed by the game loop."""
 
@@ -40,32 +65,45 @@ class GameGroups:
         self.explosions = pygame.sprite.Group()
         self.explosions2 = pygame.sprite.Group()
 
-        # player projectiles
+        # ECS entities (player bullets so far); their proxies sit in the groups
+        self.world = World()
+
+        # player projectiles, plus their per-frame collision index
         self.bullets = pygame.sprite.Group()
+        self.bullet_grid = SpatialHash()
 
         # enemies
         self.enemy1 = pygame.sprite.Group()
         self.enemy2 = pygame.sprite.Group()
         self.enemy2_bullets = pygame.sprite.Group()
 
-        # bosses (indexed 0-2)
+        # bosses (indexed 0-2) and every boss bullet
         self.boss = [pygame.sprite.Group() for _ in range(3)]
-        self.boss_bullets = [pygame.sprite.Group() for _ in range(3)]
+        self.boss_field = ProjectileField()
 
-        # refills / pickups
-        self.bullet_refill = pygame.sprite.Group()
-        self.health_refill = pygame.sprite.Group()
-        self.double_refill = pygame.sprite.Group()
-        self.extra_score = pygame.sprite.Group()
+        # refills / pickups (these and the hazards move at the tier's speed)
+        self.bullet_refill = SpeedGroup()
+        self.health_refill = SpeedGroup()
+        self.double_refill = SpeedGroup()
+        self.extra_score = SpeedGroup()
 
         # environmental hazards
-        self.meteors = pygame.sprite.Group()
-        self.meteors2 = pygame.sprite.Group()
-        self.black_holes = pygame.sprite.Group()
+        self.meteors = SpeedGroup()
+        self.meteors2 = SpeedGroup()
+        self.black_holes = SpeedGroup()
 
         # boss tracking
         self.boss_state = BossState()
 
+        # this frame's gameplay events (kills, pickups, hits)
+        self.events = EventBus()
+
+        # score tiers: hazard speeds, spawn chances, background, bosses
+        self.difficulty = Difficulty(self)
+
+        # world-bounds culling, max age and population caps
+        self.lifetime = LifetimeManager(self)
+
     # -- helpers --
 
     def _all_groups(self):
@@ -78,8 +116,6 @@ class GameGroups:
         yield self.enemy2_bullets
         for g in self.boss:
             yield g
-        for g in self.boss_bullets:
-            yield g
         yield self.bullet_refill
         yield self.health_refill
         yield self.double_refill
@@ -92,4 +128,10 @@ class GameGroups:
         """Clear every group and reset boss state."""
         for g in self._all_groups():
             g.empty()
+        self.world.clear()
+        self.boss_field.clear()
+        self.events.clear()
+        self.bullet_grid.clear()
+        self.lifetime.reset()
+        self.difficulty.reset()
         self.boss_state.reset()
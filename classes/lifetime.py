@@ -0,0 +1,126 @@
+"""Entity lifetime policy — world-bounds culling, max age and population caps.
+
+Most entities remove themselves (bullets leaving the top, meteors passing
+the bottom), but not all do: homing boss shots aimed sideways never reach
+``HEIGHT``, Enemy1 and the pickups bounce inside the screen forever.  The
+:class:`LifetimeManager` enforces one :class:`LifetimePolicy` per sprite
+group once per frame so no population can grow without bound:
+
+* ``bounds`` — kill sprites entirely outside ``WORLD_BOUNDS`` (the screen
+  plus the spawn zone above it, grown by ``BOUNDS_MARGIN``);
+* ``max_age`` — kill sprites older than this many frames;
+* ``cap`` — at most this many live sprites; the excess is evicted
+  off-screen sprites first, then oldest first.
+
+A sprite removed while on screen would just vanish, so policies with a
+``kind`` emit ``Kill(kind, sprite, pos, 'cleanup')`` to ``groups.events``
+for those and the Effects consumer shows them leaving.  Projectiles and
+explosions are removed silently.
+
+Boss bullets are not sprites; their ProjectileField applies the same
+bounds and age limits itself.
+"""
+from collections import Counter
+from dataclasses import dataclass
+from typing import Optional
+import weakref
+
+import pygame
+
+from .constants import WIDTH, HEIGHT, FPS
+from .events import Kill
+from .viewport import VIEW_RECT
+from . import framestats
+from . import pools
+
+BOUNDS_MARGIN = 300
+WORLD_BOUNDS = pygame.Rect(0, -HEIGHT, WIDTH, 2 * HEIGHT).inflate(2 * BOUNDS_MARGIN, 2 * BOUNDS_MARGIN)
+
+
+@dataclass(frozen=True)
+class LifetimePolicy:
+    bounds: bool = False
+    max_age: Optional[int] = None   # frames
+    cap: Optional[int] = None
+    kind: Optional[str] = None      # Kill kind for on-screen removals (None: silent)
+
+
+_PICKUP = LifetimePolicy(max_age=20 * FPS, cap=8, kind='pickup')
+_METEOR = LifetimePolicy(bounds=True, cap=30, kind='meteor')
+_EXPLOSION = LifetimePolicy(max_age=5 * FPS, cap=64)
+
+# GameGroups attribute -> policy (list attributes apply it to every group)
+POLICIES = {
+    'bullets': LifetimePolicy(bounds=True, max_age=5 * FPS, cap=200),
+    'enemy2_bullets': LifetimePolicy(bounds=True, max_age=8 * FPS, cap=60),
+    'enemy1': LifetimePolicy(bounds=True, cap=16, kind='enemy1'),
+    'enemy2': LifetimePolicy(bounds=True, max_age=30 * FPS, kind='enemy2'),
+    'bullet_refill': _PICKUP,
+    'health_refill': _PICKUP,
+    'double_refill': _PICKUP,
+    'extra_score': LifetimePolicy(bounds=True, cap=40, kind='pickup'),
+    'meteors': _METEOR,
+    'meteors2': _METEOR,
+    'black_holes': LifetimePolicy(bounds=True, cap=4, kind='black_hole'),
+    'explosions': _EXPLOSION,
+    'explosions2': _EXPLOSION,
+}
+
+
+class LifetimeManager:
+    """Applies :data:`POLICIES` to a GameGroups instance."""
+
+    def __init__(self, groups, policies=POLICIES):
+        self.groups = groups
+        self.policies = policies
+        self.frame = 0
+        self.removed = Counter()   # (group name, reason) -> count, for soak runs
+        self._born = weakref.WeakKeyDictionary()   # sprite -> frame first seen
+        pools.on_release(self._forget)   # a recycled sprite is born again
+
+    def enforce(self):
+        """Run every policy once; call once per frame."""
+        self.frame += 1
+        before = sum(self.removed.values())
+        for name, policy in self.policies.items():
+            group = getattr(self.groups, name)
+            for grp in (group if isinstance(group, list) else (group,)):
+                self._apply(name, grp, policy)
+        framestats.add('expired', sum(self.removed.values()) - before)
+
+    def reset(self):
+        self._born.clear()
+
+    def _forget(self, sprite):
+        self._born.pop(sprite, None)
+
+    def age(self, sprite):
+        return self.frame - self._born.get(sprite, self.frame)
+
+    def _apply(self, name, group, policy):
+        if not group:
+            return
+        born = self._born
+        frame = self.frame
+        oldest = frame - policy.max_age if policy.max_age is not None else None
+        inside = WORLD_BOUNDS.colliderect
+        for sprite in group.sprites():
+            start = born.get(sprite)
+            if start is None:
+                born[sprite] = start = frame
+            if policy.bounds and not inside(sprite.rect):
+                self._remove(name, sprite, 'bounds', None)
+            elif oldest is not None and start < oldest:
+                self._remove(name, sprite, 'age', policy.kind)
+        if policy.cap is not None and len(group) > policy.cap:
+            visible = VIEW_RECT.colliderect
+            order = sorted(group.sprites(), key=lambda s: (bool(visible(s.rect)), born[s]))
+            for sprite in order[:len(group) - policy.cap]:
+                self._remove(name, sprite, 'cap', policy.kind)
+
+    def _remove(self, name, sprite, reason, kind):
+        """Kill *sprite*; if *kind* is given and it is on screen, emit its cleanup Kill."""
+        if kind is not None and VIEW_RECT.colliderect(sprite.rect):
+            self.groups.events.emit(Kill(kind, sprite, sprite.rect.center, 'cleanup'))
+        sprite.kill()
+        self.removed[(name, reason)] += 1
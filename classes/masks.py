@@ -0,0 +1,47 @@
+"""Collision masks — pixel-accurate narrowphase behind a rect test.
+
+Rect overlap stays the first (and usually only) test; only when two rects
+overlap are the sprites' masks compared, at the offset they are drawn at.
+Masks are cached per surface: GameAssets precomputes them for every
+collidable image when it is loaded, and rotation tables build one per frame
+alongside the frame itself.  Set ``PIXEL_COLLISIONS = False`` in
+constants.py to go back to rect-only hits.
+"""
+import weakref
+
+import pygame
+
+from .constants import PIXEL_COLLISIONS
+
+_masks = weakref.WeakKeyDictionary()   # surface -> pygame.mask.Mask
+
+
+def get(image):
+    """The cached mask of *image* (built on first request)."""
+    mask = _masks.get(image)
+    if mask is None:
+        mask = _masks[image] = pygame.mask.from_surface(image)
+    return mask
+
+
+def precompute(images):
+    if PIXEL_COLLISIONS:
+        for image in images:
+            get(image)
+
+
+def overlap(image_a, pos_a, image_b, pos_b):
+    """True if *image_a* drawn at *pos_a* touches *image_b* drawn at *pos_b*."""
+    if not PIXEL_COLLISIONS:
+        return True
+    return get(image_a).overlap(get(image_b), (pos_b[0] - pos_a[0], pos_b[1] - pos_a[1])) is not None
+
+
+def collide(a, b):
+    """True if sprites *a* and *b* touch; usable as a ``spritecollide`` callback."""
+    ra, rb = a.rect, b.rect
+    if not ra.colliderect(rb):
+        return False
+    if not PIXEL_COLLISIONS:
+        return True
+    return get(a.image).overlap(get(b.image), (rb.x - ra.x, rb.y - ra.y)) is not None
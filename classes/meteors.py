@@ -1,6 +1,7 @@
 import pygame
 
 from .constants import WIDTH, HEIGHT
+from . import rotation
 from . import sound
 
 
@@ -15,7 +16,8 @@ class Meteors(pygame.sprite.Sprite):
     def __init__(self, x, y, image):
         super().__init__()
         self.original_image = image
-        self.image = self.original_image.copy()
+        self.rotations = rotation.frames(image)
+        self.image = self.original_image
         self.rect = self.image.get_rect()
         self.rect.x = x
         self.rect.y = y
@@ -31,7 +33,7 @@ class Meteors(pygame.sprite.Sprite):
             self.kill()
 
         self.angle = (self.angle - 1) % 360
-        self.image = pygame.transform.rotozoom(self.original_image, self.angle, 1)
+        self.image = self.rotations.at(self.angle)
         self.rect = self.image.get_rect(center=self.rect.center)
 
     def draw(self, surface):
@@ -49,7 +51,8 @@ class Meteors2(pygame.sprite.Sprite):
     def __init__(self, x, y, image):
         super().__init__()
         self.original_image = image
-        self.image = self.original_image.copy()
+        self.rotations = rotation.frames(image)
+        self.image = self.original_image
         self.rect = self.image.get_rect()
         self.rect.x = x
         self.rect.y = y
@@ -65,7 +68,7 @@ class Meteors2(pygame.sprite.Sprite):
             self.kill()
 
         self.angle = (self.angle - 1) % 360
-        self.image = pygame.transform.rotozoom(self.original_image, self.angle, 1)
+        self.image = self.rotations.at(self.angle)
         self.rect = self.image.get_rect(center=self.rect.center)
 
     def draw(self, surface):
@@ -77,7 +80,8 @@ class BlackHole(pygame.sprite.Sprite):
     def __init__(self, x, y, image):
         super().__init__()
         self.original_image = image
-        self.image = self.original_image.copy()
+        self.rotations = rotation.frames(image)
+        self.image = self.original_image
         self.rect = self.image.get_rect()
         self.rect.x = x
         self.rect.y = y
@@ -85,7 +89,7 @@ class BlackHole(pygame.sprite.Sprite):
         self.direction_y = 1
         self.angle = 0
         self.speed = 2
-        self.sound_effect = sound.load_sound("game_sounds/damage/black_hole.mp3")
+        self.sound_effect = sound.get_bank()['black_hole']
 
     def update(self):
         self.rect.y += self.speed * self.direction_y
@@ -94,7 +98,7 @@ class BlackHole(pygame.sprite.Sprite):
             self.kill()
 
         self.angle = (self.angle - 1) % 360
-        self.image = pygame.transform.rotozoom(self.original_image, self.angle, 1)
+        self.image = self.rotations.at(self.angle)
         self.rect = self.image.get_rect(center=self.rect.center)
 
     def draw(self, surface):
@@ -0,0 +1,102 @@
+"""Data-defined boss bullet patterns, fired into a ProjectileField.
+
+Every pattern is one :class:`Pattern` row in :data:`PATTERNS`; a volley is
+computed as arrays of headings and muzzle offsets and handed to the field
+in a single ``emit``.  Angles are degrees in screen space (0 = right,
+90 = straight down).  The common shapes are all parameter choices:
+
+* aimed shot — ``aim=True``;
+* fan — ``count`` bullets over ``spread`` degrees (aimed or fixed);
+* parallel volley — ``gap`` px between bullets sharing one heading;
+* ring — ``spread=360``;
+* spiral — a ring or fan with ``spin`` degrees added every volley.
+
+Bosses list their attacks as ``(pattern name, period in frames)`` pairs in
+their ``attacks`` class attribute.
+"""
+from dataclasses import dataclass
+import math
+from typing import Optional
+
+import numpy as np
+
+from .assets import get_assets
+from . import rotation
+from . import sound
+
+
+@dataclass(frozen=True)
+class Pattern:
+    image: str                   # GameAssets.bullets key
+    count: int = 1
+    speed: float = 8             # px per frame
+    angle: float = 90            # heading when not aimed
+    spread: float = 0            # arc covered by the volley; 360 = ring
+    gap: float = 0               # px between bullets across the heading
+    aim: bool = False            # centre the volley on the target
+    spin: float = 0              # degrees added per volley
+    orient: bool = False         # rotate each bullet to its heading
+    facing: float = 0            # heading the unrotated image points at
+    sound: Optional[str] = None  # sound bank key, played once per volley
+
+
+PATTERNS = {
+    'boss1_triple': Pattern('boss1', count=3, speed=10, gap=20, sound='boss1_shoot'),
+    'boss1_ring': Pattern('boss1', count=16, speed=4, spread=360, spin=11.25,
+                          orient=True, facing=90),
+    'boss2_aimed': Pattern('boss2', speed=11, aim=True, orient=True, sound='boss2_shoot'),
+    'boss2_fan': Pattern('boss2', count=9, speed=6, spread=80, aim=True, orient=True),
+    'boss3_aimed': Pattern('boss3', speed=15, aim=True, orient=True, sound='boss2_shoot'),
+    'boss3_spiral': Pattern('boss3', count=5, speed=5, spread=360, spin=13, orient=True),
+}
+
+
+def _kinds(field, pattern, image, headings):
+    """Field image kind of each bullet (rotated frames for oriented patterns)."""
+    if not pattern.orient:
+        return field.register(image)
+    frames = rotation.frames(image, keep=True)
+    index = np.rint((pattern.facing - headings) / frames.step).astype(np.int64) % len(frames)
+    lookup = {i: field.register(frames[i]) for i in np.unique(index).tolist()}
+    return np.array([lookup[i] for i in index.tolist()], np.int32)
+
+
+def fire(field, name, x, y, target=None, volley=0, damage=0):
+    """Emit one volley of pattern *name* from muzzle (*x*, *y*).
+
+    *target* is the (x, y) aimed patterns point at; *volley* counts this
+    pattern's previous volleys from the same emitter (for ``spin``);
+    *damage* is what each bullet deals (the emitter's ``bullet_damage``).
+    Returns the number of bullets emitted.
+    """
+    pattern = PATTERNS[name]
+    image = get_assets().bullets[pattern.image]
+    # bullets leave with their unrotated image's bottom 10 px below the muzzle
+    y += 10 - image.get_height() / 2
+
+    base = pattern.angle
+    if pattern.aim and target is not None:
+        base = math.degrees(math.atan2(target[1] - y, target[0] - x))
+    base += pattern.spin * volley
+
+    count = pattern.count
+    if count == 1:
+        offsets = np.zeros(1)
+    elif pattern.spread >= 360:
+        offsets = np.linspace(0, 360, count, endpoint=False)
+    else:
+        offsets = np.linspace(-pattern.spread / 2, pattern.spread / 2, count)
+    headings = base + offsets
+    rad = np.radians(headings)
+
+    # parallel bullets are spread across the base heading
+    lateral = (np.arange(count) - (count - 1) / 2) * pattern.gap
+    across = math.radians(base + 90)
+    xs = x + lateral * math.cos(across)
+    ys = y + lateral * math.sin(across)
+
+    emitted = field.emit(xs, ys, pattern.speed * np.cos(rad), pattern.speed * np.sin(rad),
+                         _kinds(field, pattern, image, headings), damage)
+    if pattern.sound and emitted:
+        sound.get_bank()[pattern.sound].play()
+    return emitted
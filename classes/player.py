@@ -1,6 +1,7 @@
 import pygame
 
 from .constants import WIDTH, HEIGHT
+from .assets import get_assets
 
 
 class Player:
@@ -8,8 +9,9 @@ class Player:
     def __init__(self):
         self.rect = pygame.Rect(WIDTH//2 - 100, HEIGHT - 100, 100, 100)
         self.speed = 10
-        self.image = pygame.image.load('images/player.png').convert_alpha()
-        self.original_image = self.image.copy()
+        self.image = get_assets().player['ship']
+        self.original_image = self.image
+        self.flipped_image = pygame.transform.flip(self.original_image, True, False)
         self.direction = 'down'
 
     def move(self, x_input, y_input):
@@ -22,7 +24,7 @@ class Player:
             self.rect.x = max(0, min(WIDTH - self.rect.width,
                                      self.rect.x + int(x_input * self.speed)))
             if x_input < 0:
-                self.image = pygame.transform.flip(self.original_image, True, False)
+                self.image = self.flipped_image
             else:
                 self.image = self.original_image
         if y_input:
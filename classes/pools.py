@@ -0,0 +1,152 @@
+"""Object pools for short-lived sprites (bullets, explosions, pickups).
+
+Subclassing :class:`Pooled` gives a sprite class its own :class:`Pool`.
+Calling the class as usual (``Explosion(center, images)``) acquires a
+released instance when one is free and runs ``__init__`` on it again, so
+the object, its attribute dict and (via :meth:`Pooled.place`) its rect are
+reused instead of reallocated.  Killing the sprite, or removing it from its
+last group, releases it.
+
+Released sprites only become reusable at the next :func:`end_frame`: until
+then something may still hold them from this frame (a collision snapshot,
+the bullet grid), and they must not come back to life under it.  Code that
+keys data on sprite identity can register an :func:`on_release` callback to
+forget a sprite before it is reused.
+
+Hit rate (acquires served from the pool) and high-water mark (most live
+instances at once) are kept per pool; see :func:`stats` and :func:`report`.
+"""
+import weakref
+
+import pygame
+
+FREE_LIMIT = 256   # most released instances kept per class
+
+_pools = {}           # class name -> Pool
+_release_hooks = []   # weak callables taking the released sprite
+
+
+class Pool:
+    """Free list of one class's released instances, with usage counters."""
+
+    def __init__(self, cls, limit=FREE_LIMIT):
+        self.cls = cls
+        self.limit = limit
+        self.free = []
+        self.pending = []   # released this frame, reusable after end_frame()
+        self.acquired = 0
+        self.hits = 0
+        self.live = 0
+        self.high_water = 0
+
+    def acquire(self):
+        """A free instance (``__init__`` not yet rerun), or a fresh one."""
+        self.acquired += 1
+        self.live += 1
+        if self.live > self.high_water:
+            self.high_water = self.live
+        if self.free:
+            self.hits += 1
+            obj = self.free.pop()
+        else:
+            obj = object.__new__(self.cls)
+        obj._released = False
+        return obj
+
+    def release(self, obj):
+        if obj._released:
+            return
+        obj._released = True
+        self.live -= 1
+        for hook in _release_hooks:
+            callback = hook()
+            if callback is not None:
+                callback(obj)
+        if len(self.free) + len(self.pending) < self.limit:
+            self.pending.append(obj)
+
+    def end_frame(self):
+        if self.pending:
+            self.free.extend(self.pending)
+            self.pending.clear()
+
+    @property
+    def hit_rate(self):
+        return self.hits / self.acquired if self.acquired else 0.0
+
+    def stats(self):
+        return {
+            'acquired': self.acquired,
+            'hit_rate': self.hit_rate,
+            'high_water': self.high_water,
+            'live': self.live,
+            'free': len(self.free) + len(self.pending),
+        }
+
+
+class Pooled(pygame.sprite.Sprite):
+    """Sprite base whose instances are recycled through the class's Pool."""
+
+    pool = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.pool = _pools[cls.__name__] = Pool(cls)
+
+    def __new__(cls, *args, **kwargs):
+        return cls.pool.acquire()
+
+    def place(self, image, **position):
+        """``self.rect`` resized to *image* and moved to *position*.
+
+        A recycled instance keeps its Rect; a new one gets ``image.get_rect``.
+        """
+        rect = self.__dict__.get('rect')
+        if rect is None:
+            self.rect = rect = image.get_rect()
+        else:
+            rect.size = image.get_size()
+        for attr, value in position.items():
+            setattr(rect, attr, value)
+        return rect
+
+    def kill(self):
+        super().kill()
+        self.pool.release(self)
+
+    def remove_internal(self, group):
+        super().remove_internal(group)
+        if not self.alive():
+            self.pool.release(self)
+
+
+def on_release(callback):
+    """Call *callback(sprite)* whenever a pooled sprite is released.
+
+    Bound methods are held weakly, so registering does not keep their
+    object alive.
+    """
+    if hasattr(callback, '__self__'):
+        _release_hooks.append(weakref.WeakMethod(callback))
+    else:
+        _release_hooks.append(weakref.ref(callback))
+    _release_hooks[:] = [hook for hook in _release_hooks if hook() is not None]
+
+
+def end_frame():
+    """Make this frame's released sprites reusable; call once per frame."""
+    for pool in _pools.values():
+        pool.end_frame()
+
+
+def stats():
+    """Per-class pool counters, keyed by class name."""
+    return {name: pool.stats() for name, pool in _pools.items()}
+
+
+def report():
+    """One line per pool that has been used: hit rate and high-water mark."""
+    return '\n'.join(
+        f"pool {name}: {s['acquired']} acquired, {s['hit_rate']:.0%} reused, "
+        f"high water {s['high_water']}, {s['free']} free"
+        for name, s in stats().items() if s['acquired'])
@@ -0,0 +1,63 @@
+"""Startup tracing — timed breakdown of imports, init and asset loading.
+
+Enable with ``python main.py --trace-startup`` or COSMIC_HEAT_TRACE_STARTUP=1.
+Wrap a phase in ``with trace("label"):`` or record a point in time with
+``mark("label")``; ``report()`` prints everything once, when the first
+interactive frame is on screen, and later marks are printed as they
+happen.  Disabled tracing costs one flag check.
+"""
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+ENABLED = bool(os.environ.get('COSMIC_HEAT_TRACE_STARTUP')) or '--trace-startup' in sys.argv
+
+_t0 = time.perf_counter()
+_events = []   # (start offset, duration or None, label, thread name)
+_reported = False
+
+
+@contextmanager
+def trace(label):
+    """Time the enclosed block under *label*."""
+    if not ENABLED:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _events.append((start - _t0, time.perf_counter() - start, label,
+                        threading.current_thread().name))
+
+
+def mark(label):
+    """Record that *label* happened now (printed directly after the report)."""
+    if not ENABLED:
+        return
+    event = (time.perf_counter() - _t0, None, label, threading.current_thread().name)
+    _events.append(event)
+    if _reported:
+        _print(event)
+
+
+def _print(event):
+    start, duration, name, thread = event
+    took = f"{duration * 1000:8.1f}" if duration is not None else " " * 8
+    where = "" if thread == 'MainThread' else f"  [{thread}]"
+    print(f"{start * 1000:8.1f} {took}  {name}{where}")
+
+
+def report(label="first frame"):
+    """Print the startup breakdown (only the first call does anything)."""
+    global _reported
+    if not ENABLED or _reported:
+        return
+    mark(label)
+    _reported = True
+    print("---- startup trace (ms) ----")
+    print(f"{'at':>8} {'took':>8}  phase")
+    for event in sorted(_events, key=lambda e: e[0]):
+        _print(event)
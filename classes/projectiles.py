@@ -0,0 +1,254 @@
+"""Struct-of-arrays projectile engine for boss bullet patterns.
+
+A boss volley used to be one to three Sprite bullets, each a Python object
+updating itself.  :class:`ProjectileField` instead keeps every boss bullet
+in parallel NumPy arrays (centre position, velocity, age, image kind), so a
+frame's integration, bounds/age culling and hit test against the player are
+a handful of array operations whatever the bullet count.  Live bullets are
+always packed at the front of the arrays.
+
+Images are registered once per surface as integer *kinds*.  The hit test
+is two-phase like the one for sprite projectiles: an array test of each
+bullet's box — its kind's opaque bounds, not the (rotated) surface size —
+swept along its last step, then a pixel-mask test along that step
+(``masks.overlap``) for the few bullets whose box touched the target.
+
+Benchmark (headless) with::
+
+    python -m classes.projectiles
+"""
+import numpy as np
+import pygame
+
+from .lifetime import WORLD_BOUNDS
+from .viewport import VIEW_RECT
+from .constants import FPS
+from . import framestats
+from . import masks
+
+CAPACITY = 8192           # hard cap on live bullets; excess emissions are dropped
+MAX_AGE = 10 * FPS        # frames
+
+
+class ProjectileField:
+    """All boss bullets, one row per bullet in parallel arrays."""
+
+    COLUMNS = ('x', 'y', 'vx', 'vy', 'age', 'kind', 'damage')
+
+    def __init__(self, capacity=CAPACITY, max_age=MAX_AGE, bounds=WORLD_BOUNDS):
+        self.capacity = capacity
+        self.max_age = max_age
+        self.bounds = bounds
+        self.n = 0
+        size = 256
+        self.x = np.zeros(size, np.float32)
+        self.y = np.zeros(size, np.float32)
+        self.vx = np.zeros(size, np.float32)
+        self.vy = np.zeros(size, np.float32)
+        self.age = np.zeros(size, np.int32)
+        self.kind = np.zeros(size, np.int32)
+        self.damage = np.zeros(size, np.int32)
+        # per-kind tables
+        self.images = []
+        self._kinds = {}   # surface -> kind
+        self._half = np.zeros((0, 2), np.float32)   # kind -> (half width, half height)
+        self._box = np.zeros((0, 4), np.float32)    # kind -> opaque left, top, right, bottom from centre
+
+    def __len__(self):
+        return self.n
+
+    # -- images --
+
+    def register(self, image):
+        """Integer id of *image* (registered on first use)."""
+        kind = self._kinds.get(image)
+        if kind is None:
+            kind = self._kinds[image] = len(self.images)
+            self.images.append(image)
+            w, h = image.get_size()
+            self._half = np.vstack((self._half, np.float32((w / 2, h / 2))))
+            opaque = masks.get(image).get_bounding_rects()
+            if opaque:
+                box = opaque[0].unionall(opaque[1:])
+                box = (box.left - w / 2, box.top - h / 2, box.right - w / 2, box.bottom - h / 2)
+            else:
+                box = (0, 0, 0, 0)   # fully transparent: never hits
+            self._box = np.vstack((self._box, np.float32(box)))
+        return kind
+
+    # -- emission --
+
+    def _reserve(self, extra):
+        size = len(self.x)
+        need = self.n + extra
+        if need <= size:
+            return
+        while size < need:
+            size *= 2
+        for name in self.COLUMNS:
+            old = getattr(self, name)
+            new = np.zeros(size, old.dtype)
+            new[:self.n] = old[:self.n]
+            setattr(self, name, new)
+
+    def emit(self, x, y, vx, vy, kind, damage=0):
+        """Add bullets centred at *x*, *y* moving *vx*, *vy* per frame.
+
+        Arguments are scalars or equal-length arrays; *damage* is what each
+        bullet deals on a hit.  Returns how many bullets were added (fewer
+        than asked once ``capacity`` is reached).
+        """
+        x, y, vx, vy, kind, damage = np.broadcast_arrays(x, y, vx, vy, kind, damage)
+        count = min(len(x) if x.ndim else 1, self.capacity - self.n)
+        if count <= 0:
+            return 0
+        self._reserve(count)
+        s = slice(self.n, self.n + count)
+        for name, values in (('x', x), ('y', y), ('vx', vx), ('vy', vy), ('kind', kind),
+                             ('damage', damage)):
+            getattr(self, name)[s] = values.ravel()[:count]
+        self.age[s] = 0
+        self.n += count
+        return count
+
+    def clear(self):
+        self.n = 0
+
+    # -- per-frame work --
+
+    def _keep(self, keep):
+        """Pack the rows where *keep* is true to the front."""
+        n = self.n
+        kept = int(np.count_nonzero(keep))
+        if kept == n:
+            return 0
+        for name in self.COLUMNS:
+            arr = getattr(self, name)
+            arr[:kept] = arr[:n][keep]
+        self.n = kept
+        return n - kept
+
+    def update(self):
+        """Move every bullet one step; drop those too old or out of bounds."""
+        n = self.n
+        if not n:
+            return
+        x, y = self.x[:n], self.y[:n]
+        x += self.vx[:n]
+        y += self.vy[:n]
+        self.age[:n] += 1
+        b = self.bounds
+        keep = (self.age[:n] <= self.max_age) & (x >= b.left) & (x < b.right) & (y >= b.top) & (y < b.bottom)
+        framestats.add('expired', self._keep(keep))
+
+    def collide(self, image, rect):
+        """Remove the bullets that hit *image* drawn at *rect*; return their damage.
+
+        Boxes swept from each bullet's previous position are tested as
+        arrays; only bullets whose box touched *rect* get the mask test.
+        """
+        n = self.n
+        if not n:
+            return []
+        framestats.add('tests', n)
+        box = self._box[self.kind[:n]]
+        x, y = self.x[:n], self.y[:n]
+        px, py = x - self.vx[:n], y - self.vy[:n]
+        hit = ((np.maximum(x, px) + box[:, 2] > rect.left) &
+               (np.minimum(x, px) + box[:, 0] < rect.right) &
+               (np.maximum(y, py) + box[:, 3] > rect.top) &
+               (np.minimum(y, py) + box[:, 1] < rect.bottom))
+        candidates = np.flatnonzero(hit)
+        if not len(candidates):
+            return []
+        for i in candidates.tolist():
+            if not self._touches(i, image, rect.topleft):
+                hit[i] = False
+        damage = self.damage[:n][hit].tolist()
+        if damage:
+            self._keep(~hit)
+        return damage
+
+    def _touches(self, i, image, pos):
+        """Mask test of bullet *i* along its last step, against *image* at *pos*.
+
+        Samples the step at both ends and at points no further apart than
+        the bullet's opaque size, so a fast bullet cannot skip the target.
+        """
+        kind = int(self.kind[i])
+        surface = self.images[kind]
+        hw, hh = self._half[kind].tolist()
+        left, top, right, bottom = self._box[kind].tolist()
+        x, y, vx, vy = float(self.x[i]), float(self.y[i]), float(self.vx[i]), float(self.vy[i])
+        steps = 1 + int(max(abs(vx), abs(vy)) / max(1.0, min(right - left, bottom - top)))
+        for j in range(steps + 1):
+            back = 1 - j / steps
+            corner = (round(x - vx * back - hw), round(y - vy * back - hh))
+            if masks.overlap(surface, corner, image, pos):
+                return True
+        return False
+
+    def draw(self, view):
+        """Blit the bullets inside the view onto *view* in one batched call."""
+        n = self.n
+        if not n:
+            return
+        kind = self.kind[:n]
+        half = self._half[kind]
+        left = self.x[:n] - half[:, 0]
+        top = self.y[:n] - half[:, 1]
+        visible = ((left < VIEW_RECT.right) & (left + 2 * half[:, 0] > VIEW_RECT.left) &
+                   (top < VIEW_RECT.bottom) & (top + 2 * half[:, 1] > VIEW_RECT.top))
+        left, top, kind = left[visible], top[visible], kind[visible]
+        if view.scale != 1:
+            left *= view.scale
+            top *= view.scale
+        sources = [view.source(image) for image in self.images]
+        items = [(sources[k][0], (x, y), sources[k][1])
+                 for k, x, y in zip(kind.tolist(), np.rint(left).astype(np.int32).tolist(),
+                                    np.rint(top).astype(np.int32).tolist())]
+        view.surface.blits(items, doreturn=False)
+        framestats.add('blits', len(items))
+        framestats.add('blits_culled', n - len(items))
+
+
+# ---------------------------------------------------------------------------
+#  Benchmark
+# ---------------------------------------------------------------------------
+
+def benchmark(counts=(500, 1000, 2000, 4000, 8000), frames=120):
+    """Time update + hit test + draw per frame for N bullets in flight."""
+    import time
+
+    from .constants import WIDTH, HEIGHT
+    from .viewport import Viewport
+
+    view = Viewport(pygame.Surface((WIDTH, HEIGHT)))
+    image = pygame.Surface((12, 12), pygame.SRCALPHA)
+    pygame.draw.circle(image, (255, 80, 80), (6, 6), 6)
+    player_image = pygame.Surface((100, 64), pygame.SRCALPHA)
+    pygame.draw.polygon(player_image, (200, 200, 255), ((50, 0), (100, 64), (0, 64)))
+    player = player_image.get_rect(topleft=(WIDTH // 2 - 50, HEIGHT - 150))
+    rng = np.random.default_rng(1)
+    print(f"{'n':>6} {'update':>8} {'collide':>8} {'draw':>8}  (ms per frame)")
+    for count in counts:
+        field = ProjectileField(capacity=count)
+        kind = field.register(image)
+        timings = np.zeros(3)
+        for _ in range(frames):
+            # keep the field full: refill what left the screen last frame
+            missing = count - len(field)
+            angle = rng.uniform(0, 2 * np.pi, missing)
+            field.emit(rng.uniform(0, WIDTH, missing), rng.uniform(0, HEIGHT, missing),
+                       3 * np.cos(angle), 3 * np.sin(angle), kind)
+            for i, step in enumerate((field.update, lambda: field.collide(player_image, player),
+                                      lambda: field.draw(view))):
+                start = time.perf_counter()
+                step()
+                timings[i] += time.perf_counter() - start
+        update, collide, draw = timings / frames * 1000
+        print(f"{count:>6} {update:>8.3f} {collide:>8.3f} {draw:>8.3f}")
+
+
+if __name__ == '__main__':
+    benchmark()
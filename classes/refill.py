@@ -1,11 +1,11 @@
-import pygame
 import random
 
 from .constants import WIDTH, HEIGHT
 from . import sound
+from .pools import Pooled
 
 
-class BulletRefill(pygame.sprite.Sprite):
+class BulletRefill(Pooled):
 
     health_restore = 0
     ammo_restore = 50
@@ -14,14 +14,11 @@ class BulletRefill(pygame.sprite.Sprite):
     def __init__(self, x, y, image):
         super().__init__()
         self.image = image
-        self.rect = self.image.get_rect()
-        self.rect.x = x
-        self.rect.y = y
+        self.place(image, x=x, y=y)
         self.speed = 1
         self.direction_x = random.choice([-2, 2])
         self.direction_y = random.choice([-2, 2])
-        self.sound_effect = sound.load_sound("game_sounds/refill/bullet_refill.wav")
-        self.sound_effect.set_volume(0.4)
+        self.sound_effect = sound.get_bank()['bullet_refill']
 
     def update(self):
         self.rect.y += self.speed * self.direction_y
@@ -38,7 +35,7 @@ class BulletRefill(pygame.sprite.Sprite):
         surface.blit(self.image, self.rect)
 
 
-class HealthRefill(pygame.sprite.Sprite):
+class HealthRefill(Pooled):
 
     health_restore = 50
     ammo_restore = 0
@@ -47,14 +44,11 @@ class HealthRefill(pygame.sprite.Sprite):
     def __init__(self, x, y, image):
         super().__init__()
         self.image = image
-        self.rect = self.image.get_rect()
-        self.rect.x = x
-        self.rect.y = y
+        self.place(image, x=x, y=y)
         self.speed = 1
         self.direction_x = random.choice([-2, 2])
         self.direction_y = random.choice([-2, 2])
-        self.sound_effect = sound.load_sound("game_sounds/refill/health_refill.wav")
-        self.sound_effect.set_volume(0.4)
+        self.sound_effect = sound.get_bank()['health_refill']
 
     def update(self):
         self.rect.y += self.speed * self.direction_y
@@ -71,7 +65,7 @@ class HealthRefill(pygame.sprite.Sprite):
         surface.blit(self.image, self.rect)
 
 
-class DoubleRefill(pygame.sprite.Sprite):
+class DoubleRefill(Pooled):
 
     health_restore = 50
     ammo_restore = 50
@@ -80,14 +74,11 @@ class DoubleRefill(pygame.sprite.Sprite):
     def __init__(self, x, y, image):
         super().__init__()
         self.image = image
-        self.rect = self.image.get_rect()
-        self.rect.x = x
-        self.rect.y = y
+        self.place(image, x=x, y=y)
         self.speed = 2
         self.direction_x = random.choice([-2, 2])
         self.direction_y = random.choice([-2, 2])
-        self.sound_effect = sound.load_sound("game_sounds/refill/double_refill.mp3")
-        self.sound_effect.set_volume(0.4)
+        self.sound_effect = sound.get_bank()['double_refill']
 
     def update(self):
         self.rect.y += self.speed * self.direction_y
@@ -104,7 +95,7 @@ class DoubleRefill(pygame.sprite.Sprite):
         surface.blit(self.image, self.rect)
 
 
-class ExtraScore(pygame.sprite.Sprite):
+class ExtraScore(Pooled):
 
     health_restore = 0
     ammo_restore = 0
@@ -112,16 +103,12 @@ class ExtraScore(pygame.sprite.Sprite):
 
     def __init__(self, x, y, image):
         super().__init__()
-        self.original_image = image
-        self.image = self.original_image.copy()
-        self.rect = self.image.get_rect()
+        self.image = image
+        self.place(image, x=x, y=y)
         self.speed = 2
-        self.rect.x = x
-        self.rect.y = y
         self.direction_x = 0
         self.direction_y = 1
-        self.sound_effect = sound.load_sound("game_sounds/refill/extra_score.mp3")
-        self.sound_effect.set_volume(0.4)
+        self.sound_effect = sound.get_bank()['extra_score']
 
     def update(self):
         self.rect.y += self.speed * self.direction_y
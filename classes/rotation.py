@@ -0,0 +1,156 @@
+"""Rotation cache — pre-rotated frames for sprites drawn at an angle.
+
+Meteors and black holes used to ``rotozoom`` their image every frame, per
+instance, and aimed boss bullets re-rotated theirs every tick.  Instead,
+every source image gets one shared :class:`RotationFrames` table holding a
+rotated copy per ``ROTATION_STEP`` degrees, filled on first use; a spinning
+sprite picks the frame for its current angle, a bullet picks one for its
+heading at spawn.  A table lives as long as some sprite holds it, so rare
+large hazards (black holes) give their frames back once they have left the
+screen.
+
+Set COSMIC_HEAT_ROTATION_CACHE=1 to keep the tables on disk between runs
+(``.cache/rotations-<step>.pack``, same format as the asset pack): frames are
+read back when gameplay assets finish loading and written when the game exits.
+"""
+import os
+import weakref
+
+import pygame
+
+from .constants import ROTATION_STEP
+from . import assetpack
+from . import masks
+from . import surfaces
+
+CACHE_DIR = '.cache'
+PERSIST = bool(os.environ.get('COSMIC_HEAT_ROTATION_CACHE'))
+
+
+class RotationFrames:
+    """Rotated copies of one image, one per angle step (filled lazily)."""
+
+    __slots__ = ('image', 'step', 'rle', '_frames', '__weakref__')
+
+    def __init__(self, image, step):
+        self.image = image
+        self.step = step
+        # rotating only adds transparent corners, so the source decides for all frames
+        self.rle = surfaces.transparent_fraction(image) >= surfaces.RLE_MIN_TRANSPARENT
+        self._frames = [None] * round(360 / step)
+
+    def __len__(self):
+        return len(self._frames)
+
+    def index(self, angle):
+        """Frame index for *angle* in degrees."""
+        return round(angle / self.step) % len(self._frames)
+
+    def at(self, angle):
+        """The frame closest to *angle* degrees."""
+        return self[self.index(angle)]
+
+    def __getitem__(self, index):
+        frame = self._frames[index]
+        if frame is None:
+            frame = self._frames[index] = self._rotate(index)
+        return frame
+
+    def _rotate(self, index):
+        return self.accelerate(pygame.transform.rotozoom(self.image, index * self.step, 1))
+
+    def accelerate(self, frame):
+        """Give *frame* (already in display format) its mask and the table's RLE setting."""
+        masks.precompute((frame,))  # before RLE: reading pixels decodes it
+        if self.rle:
+            frame.set_alpha(255, pygame.RLEACCEL)
+        return frame
+
+    def fill(self):
+        """Compute every frame now."""
+        for index in range(len(self._frames)):
+            self[index]
+
+    def nbytes(self):
+        return sum(f.get_pitch() * f.get_height() for f in self._frames if f is not None)
+
+
+class RotationCache:
+    """Shared :class:`RotationFrames` per source image."""
+
+    def __init__(self, step=ROTATION_STEP, persist=PERSIST):
+        self.step = step
+        self.persist = persist
+        self.path = os.path.join(CACHE_DIR, f'rotations-{step}.pack')
+        self._tables = weakref.WeakValueDictionary()   # image -> RotationFrames
+        self._named = {}    # image -> (stable name, source paths), for persistence
+        self._kept = {}     # image -> RotationFrames held for the session
+        self._pack = None
+
+    def frames(self, image, keep=False):
+        """The rotation table for *image* (created on first request).
+
+        *keep* holds the table for the whole session, for small images whose
+        sprites come and go in bursts.
+        """
+        table = self._tables.get(image)
+        if table is None:
+            table = self._tables[image] = RotationFrames(image, self.step)
+            if self._pack is not None and image in self._named:
+                self._restore(table)
+        if keep:
+            self._kept[image] = table
+        return table
+
+    def register(self, name, image, sources):
+        """Give *image* a stable *name* so its frames can be persisted."""
+        self._named[image] = (name, sources)
+
+    def nbytes(self):
+        return sum(t.nbytes() for t in self._tables.values())
+
+    def load(self):
+        """Open the persisted frames; tables are restored from them on creation."""
+        if self.persist and self._pack is None:
+            self._pack = assetpack.open_pack(self.path)
+
+    def _restore(self, table):
+        name, sources = self._named[table.image]
+        frames = self._pack.get([f'{name}/{i}' for i in range(len(table))], sources)
+        if frames is not None:
+            table._frames = [table.accelerate(f) for f in frames]
+
+    def save(self):
+        """Write every registered image's full frame table to disk."""
+        if not self.persist or not self._named:
+            return
+        entries = []
+        sources = []
+        for image, (name, paths) in self._named.items():
+            table = self.frames(image)
+            table.fill()
+            entries.extend((f'{name}/{i}', table[i]) for i in range(len(table)))
+            sources.extend(paths)
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            assetpack.write_pack(self.path, entries, sorted(set(sources)))
+        except (OSError, pygame.error):
+            print(f"Warning: could not write rotation cache {self.path}")
+
+
+# ---- singleton access ----
+
+_cache = None
+
+
+def get_cache():
+    """Get the global RotationCache instance."""
+    global _cache
+    if _cache is None:
+        _cache = RotationCache()
+    return _cache
+
+
+def frames(image, keep=False):
+    """Shorthand for ``get_cache().frames(image, keep)``."""
+    return get_cache().frames(image, keep)
@@ -1,4 +1,10 @@
 """Sound utilities that gracefully handle missing audio devices."""
+import hashlib
+import os
+import sys
+import threading
+import wave
+
 import pygame
 
 _audio_available = False
@@ -32,21 +38,225 @@ class DummySound:
         pass
 
 
+# ---------------------------------------------------------------------------
+#  Decoded PCM cache — compressed files are decoded once, then bulk-read
+# ---------------------------------------------------------------------------
+
+PCM_CACHE_DIR = '.cache/pcm'
+_CACHED_EXTENSIONS = ('.mp3', '.ogg')
+
+_hashes = {}          # (path, size, mtime) -> content hash
+_music_jobs = set()   # sources whose WAV cache is being written
+_lock = threading.Lock()
+
+
+def _source_hash(path):
+    st = os.stat(path)
+    key = (path, st.st_size, st.st_mtime_ns)
+    digest = _hashes.get(key)
+    if digest is None:
+        with open(path, 'rb') as f:
+            digest = _hashes[key] = hashlib.sha1(f.read()).hexdigest()[:16]
+    return digest
+
+
+def _cache_stem(path):
+    return os.path.splitext(path)[0].replace('/', '_').replace(os.sep, '_')
+
+
+def _cache_path(path, ext):
+    """Cache file for *path*, keyed by its content hash and the mixer format."""
+    freq, fmt, channels = pygame.mixer.get_init()
+    name = f"{_cache_stem(path)}-{_source_hash(path)}-{freq}_{fmt}_{channels}{ext}"
+    return os.path.join(PCM_CACHE_DIR, name)
+
+
+def _replace_cache(path, target, write):
+    """Atomically write *target* via write(file) and drop older caches of *path*."""
+    try:
+        os.makedirs(PCM_CACHE_DIR, exist_ok=True)
+        tmp = f"{target}.{threading.get_ident()}.tmp"
+        with open(tmp, 'wb') as f:
+            write(f)
+        os.replace(tmp, target)
+        prefix = _cache_stem(path) + '-'
+        for name in os.listdir(PCM_CACHE_DIR):
+            if name.startswith(prefix) and name != os.path.basename(target) \
+                    and not name.endswith('.tmp'):
+                os.remove(os.path.join(PCM_CACHE_DIR, name))
+    except OSError:
+        pass  # the cache is an optimisation only
+
+
+def _load_cached_sound(path):
+    """Sound for a compressed file, from the PCM cache when available."""
+    cached = _cache_path(path, '.pcm')
+    try:
+        with open(cached, 'rb') as f:
+            return pygame.mixer.Sound(buffer=f.read())
+    except FileNotFoundError:
+        pass
+    snd = pygame.mixer.Sound(path)
+    raw = snd.get_raw()
+    _replace_cache(path, cached, lambda f: f.write(raw))
+    return snd
+
+
+def _write_music_cache(path, cached):
+    try:
+        raw = pygame.mixer.Sound(path).get_raw()
+        freq, _, channels = pygame.mixer.get_init()
+
+        def write(f):
+            with wave.open(f, 'wb') as wav:
+                wav.setnchannels(channels)
+                wav.setsampwidth(2)
+                wav.setframerate(freq)
+                wav.writeframes(raw)
+
+        _replace_cache(path, cached, write)
+    except (pygame.error, OSError):
+        pass
+    finally:
+        with _lock:
+            _music_jobs.discard(path)
+
+
+def _music_source(path):
+    """WAV from the PCM cache if present, else *path* (filling the cache in the background).
+
+    Only signed 16-bit little-endian mixer output maps directly onto WAV.
+    """
+    if (not path.lower().endswith(_CACHED_EXTENSIONS)
+            or pygame.mixer.get_init()[1] != -16 or sys.byteorder != 'little'):
+        return path
+    cached = _cache_path(path, '.wav')
+    if os.path.exists(cached):
+        return cached
+    with _lock:
+        if path in _music_jobs:
+            return path
+        _music_jobs.add(path)
+    threading.Thread(target=_write_music_cache, args=(path, cached), daemon=True).start()
+    return path
+
+
 def load_sound(path):
-    """Load a sound file, returning a DummySound if audio is unavailable."""
+    """Load a sound file, returning a DummySound if audio is unavailable.
+
+    MP3/OGG files are decoded once and cached as raw PCM under
+    PCM_CACHE_DIR; later loads are a single bulk read.
+    """
     if _audio_available:
         try:
+            if path.lower().endswith(_CACHED_EXTENSIONS):
+                return _load_cached_sound(path)
             return pygame.mixer.Sound(path)
         except pygame.error:
             return DummySound()
     return DummySound()
 
 
+# ---------------------------------------------------------------------------
+#  Sound bank — every effect decoded once, shared handles by key
+# ---------------------------------------------------------------------------
+
+# key -> (path, volume); volume None keeps the mixer default
+SOUND_FILES = {
+    'shoot':          ('game_sounds/shooting/shoot.mp3', 0.4),
+    'enemy2_shoot':   ('game_sounds/shooting/shoot2.mp3', 0.3),
+    'boss1_shoot':    ('game_sounds/shooting/boss1shoot.mp3', 0.4),
+    'boss2_shoot':    ('game_sounds/shooting/boss2shoot.mp3', 0.4),
+    'explosion1':     ('game_sounds/explosions/explosion1.wav', 0.3),
+    'explosion2':     ('game_sounds/explosions/explosion2.wav', 0.3),
+    'explosion3':     ('game_sounds/explosions/explosion3.wav', 0.3),
+    'bullet_refill':  ('game_sounds/refill/bullet_refill.wav', 0.4),
+    'health_refill':  ('game_sounds/refill/health_refill.wav', 0.4),
+    'double_refill':  ('game_sounds/refill/double_refill.mp3', 0.4),
+    'extra_score':    ('game_sounds/refill/extra_score.mp3', 0.4),
+    'black_hole':     ('game_sounds/damage/black_hole.mp3', None),
+    'warning':        ('game_sounds/warning.mp3', None),
+    'menu_explosion': ('game_sounds/explosions/explosion1.wav', 0.25),
+}
+
+
+def _copy_sound(snd):
+    """Independent Sound sharing *snd*'s PCM (separate volume, no decode)."""
+    if isinstance(snd, DummySound):
+        return DummySound()
+    try:
+        return pygame.mixer.Sound(buffer=snd.get_raw())
+    except pygame.error:
+        return DummySound()
+
+
+class SoundBank:
+    """Decodes each sound file once and hands out shared handles by key.
+
+    Volumes are applied once when a handle is created.  Keys that share a
+    file but need a different volume get their own handle over a copy of
+    the already-decoded PCM.  Unknown keys raise KeyError.
+    """
+
+    def __init__(self, files=None):
+        self._files = SOUND_FILES if files is None else files
+        self._decoded = {}   # path -> Sound
+        self._owner = {}     # path -> key whose handle is the decoded Sound
+        self._sounds = {}    # key -> Sound handle
+
+    def path(self, key):
+        return self._files[key][0]
+
+    def is_decoded(self, path):
+        return path in self._decoded
+
+    def store(self, path, snd):
+        """Register an already-decoded sound for *path* (e.g. from a worker)."""
+        self._decoded.setdefault(path, snd)
+
+    def get(self, key):
+        """Return the shared handle for *key*, decoding on first use."""
+        snd = self._sounds.get(key)
+        if snd is None:
+            snd = self._sounds[key] = self._make(key)
+        return snd
+
+    __getitem__ = get
+
+    def preload(self, keys):
+        for key in keys:
+            self.get(key)
+
+    def _make(self, key):
+        path, volume = self._files[key]
+        if path not in self._decoded:
+            self._decoded[path] = load_sound(path)
+        if path in self._owner:
+            snd = _copy_sound(self._decoded[path])
+        else:
+            snd = self._decoded[path]
+            self._owner[path] = key
+        if volume is not None:
+            snd.set_volume(volume)
+        return snd
+
+
+_bank = None
+
+
+def get_bank():
+    """Get the global SoundBank instance."""
+    global _bank
+    if _bank is None:
+        _bank = SoundBank()
+    return _bank
+
+
 def load_music(path):
-    """Load music for background playback."""
+    """Load music for background playback (decoded WAV from the cache when available)."""
     if _audio_available:
         try:
-            pygame.mixer.music.load(path)
+            pygame.mixer.music.load(_music_source(path))
         except pygame.error:
             pass
 
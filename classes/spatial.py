@@ -0,0 +1,152 @@
+"""Uniform-grid spatial hash for bullet collision broadphase.
+
+``pygame.sprite.spritecollide`` tests a sprite against every member of a
+group, so checking each hazard against the player's bullets costs
+O(hazards x bullets).  The gameplay loop instead indexes ``groups.bullets``
+into a :class:`SpatialHash` once per frame, and the ``process_*`` functions
+only test the bullets sharing a grid cell with the hazard.
+
+Benchmark against the brute-force version with::
+
+    python -m classes.spatial
+"""
+import math
+
+import pygame
+
+from . import framestats
+
+CELL_SIZE = 64
+
+
+class SpatialHash:
+    """Sprites bucketed by the grid cells their rects overlap."""
+
+    def __init__(self, cell_size=CELL_SIZE):
+        self.cell_size = cell_size
+        self._cells = {}   # (cx, cy) -> [sprite, ...]
+
+    def _span(self, rect):
+        cs = self.cell_size
+        x0, y0 = rect.left // cs, rect.top // cs
+        x1 = max(x0, (rect.right - 1) // cs)
+        y1 = max(y0, (rect.bottom - 1) // cs)
+        return x0, y0, x1, y1
+
+    def clear(self):
+        self._cells.clear()
+
+    def insert(self, sprite, rect=None):
+        """Index *sprite* under *rect* (default: its own rect)."""
+        cells = self._cells
+        x0, y0, x1, y1 = self._span(rect or sprite.rect)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [sprite]
+                else:
+                    bucket.append(sprite)
+
+    def build(self, sprites, bounds=None):
+        """Re-index *sprites* from scratch (call once per frame).
+
+        *bounds*, if given, maps a sprite to the rect to index it under.
+        """
+        self._cells.clear()
+        for sprite in sprites:
+            self.insert(sprite, bounds(sprite) if bounds else None)
+
+    def query(self, rect):
+        """Candidate sprites in the cells *rect* overlaps, each listed once."""
+        cells = self._cells
+        x0, y0, x1, y1 = self._span(rect)
+        if x0 == x1 and y0 == y1:
+            return cells.get((x0, y0), ())
+        found = {}
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    for sprite in bucket:
+                        found[sprite] = None
+        return found
+
+    def collide(self, sprite, dokill=False, collided=None):
+        """Drop-in for ``spritecollide(sprite, indexed_group, dokill, collided)``.
+
+        As with ``spritecollide``, *collided* replaces the rect test.
+        Sprites killed since the last :meth:`build` are skipped.
+        """
+        rect = sprite.rect
+        candidates = self.query(rect)
+        framestats.add('tests', len(candidates))
+        if collided is None:
+            hits = [other for other in candidates
+                    if other.alive() and rect.colliderect(other.rect)]
+        else:
+            hits = [other for other in candidates
+                    if other.alive() and collided(sprite, other)]
+        if dokill:
+            for other in hits:
+                other.kill()
+        return hits
+
+
+# ---------------------------------------------------------------------------
+#  Benchmark
+# ---------------------------------------------------------------------------
+
+def _bench_world(count, rng, per_screen=100):
+    """*count* bullets and hazards on a field holding *per_screen* of each per screen.
+
+    The field grows with *count*, so crowding (and so the real hits per
+    hazard) stays the same and only the number of entities changes.
+    """
+    from .constants import WIDTH, HEIGHT
+
+    scale = math.sqrt(count / per_screen)
+    width, height = round(WIDTH * scale), round(HEIGHT * scale)
+
+    def sprite(w, h):
+        s = pygame.sprite.Sprite()
+        s.rect = pygame.Rect(rng.randrange(width - w), rng.randrange(height - h), w, h)
+        return s
+
+    bullets = pygame.sprite.Group(sprite(9, 30) for _ in range(count))
+    hazards = [sprite(70, 70) for _ in range(count)]
+    return bullets, hazards, (width, height)
+
+
+def benchmark(counts=(100, 200, 400, 800, 1600), rounds=5):
+    """Time one frame's worth of hazard-vs-bullet tests, brute force vs grid.
+
+    Density is held at one screenful's worth per 1200x800 of field, so the
+    grid column should grow about linearly with n and brute force with n².
+    """
+    import random
+    import time
+
+    rng = random.Random(1)
+    grid = SpatialHash()
+    print(f"{'n':>6} {'field':>10} {'spritecollide':>14} {'grid':>10} {'grid/n':>8}"
+          "  (ms per frame, n bullets x n hazards; grid/n in us)")
+    for n in counts:
+        bullets, hazards, (width, height) = _bench_world(n, rng)
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for hazard in hazards:
+                pygame.sprite.spritecollide(hazard, bullets, False)
+        brute = (time.perf_counter() - start) / rounds
+        start = time.perf_counter()
+        for _ in range(rounds):
+            grid.build(bullets)
+            for hazard in hazards:
+                grid.collide(hazard)
+        hashed = (time.perf_counter() - start) / rounds
+        print(f"{n:>6} {f'{width}x{height}':>10} {brute * 1000:>14.2f} {hashed * 1000:>10.2f}"
+              f" {hashed / n * 1e6:>8.2f}")
+
+
+if __name__ == '__main__':
+    benchmark()
@@ -0,0 +1,86 @@
+"""Display-format rules for registry surfaces.
+
+Every surface GameAssets hands out goes through :func:`prepare` at load
+time: it is converted to the display's pixel format and, when mostly
+transparent, given RLE acceleration.  Run with COSMIC_HEAT_CHECK_FORMATS=1
+to have the renderer report any surface that reaches a blit in another
+format.
+"""
+import os
+import weakref
+
+import pygame
+
+# RLE only pays off for sprites that are mostly empty and never transformed
+RLE_MIN_TRANSPARENT = 0.5
+
+CHECK_FORMATS = bool(os.environ.get('COSMIC_HEAT_CHECK_FORMATS'))
+
+_formats = None
+_flagged = weakref.WeakSet()
+
+
+def _display_formats():
+    """(opaque, alpha) format signatures of the current display."""
+    global _formats
+    if _formats is None:
+        probe = pygame.Surface((1, 1))
+        _formats = (
+            _signature(probe.convert()),
+            _signature(probe.convert_alpha()),
+        )
+    return _formats
+
+
+def _signature(surf):
+    return surf.get_bitsize(), surf.get_masks(), bool(surf.get_flags() & pygame.SRCALPHA)
+
+
+def is_display_format(surf):
+    """True if blitting *surf* to the screen needs no per-pixel conversion."""
+    opaque, alpha = _display_formats()
+    return _signature(surf) in (opaque, alpha)
+
+
+def transparent_fraction(surf):
+    w, h = surf.get_size()
+    if not w or not h:
+        return 0.0
+    return 1.0 - pygame.mask.from_surface(surf).count() / (w * h)
+
+
+def prepare(surf, alpha=True, rle=False):
+    """Return *surf* in display format, RLE-accelerated when worthwhile."""
+    if alpha:
+        if _signature(surf) != _display_formats()[1]:
+            surf = surf.convert_alpha()
+        if rle:
+            accelerate(surf)
+    elif _signature(surf) != _display_formats()[0]:
+        surf = surf.convert()
+    return surf
+
+
+def accelerate(surf):
+    """RLE-accelerate alpha surface *surf* if enough of it is transparent.
+
+    Build anything that reads its pixels (collision masks) first: reading
+    an RLE surface decodes and re-encodes it.
+    """
+    if transparent_fraction(surf) >= RLE_MIN_TRANSPARENT:
+        surf.set_alpha(255, pygame.RLEACCEL)
+    return surf
+
+
+def check_blit(surf, what):
+    """Report *surf* (once) if it is about to be blitted in the wrong format."""
+    if surf in _flagged or is_display_format(surf):
+        return
+    _flagged.add(surf)
+    print(f"Warning: {what} blitted in non-display format "
+          f"({surf.get_bitsize()} bpp, masks {surf.get_masks()})")
+
+
+def check_sprites(sprites, what):
+    for sprite in sprites:
+        check_blit(sprite.image, f"{what} {type(sprite).__name__}")
@@ -3,6 +3,7 @@ import pygame
 
 from .constants import WIDTH, HEIGHT
 from .display import get_screen
+from . import fonts
 from . import sound
 
 
@@ -16,8 +17,8 @@ def music_background():
 def show_game_over(score):
     """Display the GAME OVER splash and wait before returning."""
     screen = get_screen()
-    font = pygame.font.SysFont('Impact', 50)
-    font_small = pygame.font.SysFont('Impact', 30)
+    font = fonts.get_font('Impact', 50)
+    font_small = fonts.get_font('Impact', 30)
     text = font.render("GAME OVER", True, (139, 0, 0))
     text_rect = text.get_rect(center=(WIDTH / 2, HEIGHT / 2 - 50))
     score_text = font_small.render(f"Final Score: {score}", True, (255, 255, 255))
@@ -34,7 +35,7 @@ def show_game_over(score):
 def show_game_win():
     """Display the WIN splash and wait before returning."""
     screen = get_screen()
-    font = pygame.font.SysFont('Impact', 50)
+    font = fonts.get_font('Impact', 50)
     text = font.render("AWESOME! GO ON!", True, (255, 255, 255))
     text_rect = text.get_rect(center=(WIDTH / 2, HEIGHT / 2))
     screen.blit(text, text_rect)
@@ -83,7 +84,7 @@ def draw_hud(screen, player_life, bullet_counter, score, hi_score,
     screen.blit(bullet_counter_surface, (10, bullet_y_pos))
 
     # --- Score ---
-    score_surface = pygame.font.SysFont('Comic Sans MS', 30).render(
+    score_surface = fonts.get_font('Comic Sans MS', 30).render(
         f'{score}', True, (238, 232, 170))
     score_image_rect = score_surface.get_rect()
     score_image_rect.x = WIDTH - score_image_rect.width - extra_score_img.get_width() - 10
@@ -94,7 +95,7 @@ def draw_hud(screen, player_life, bullet_counter, score, hi_score,
     screen.blit(score_surface, score_image_rect)
 
     # --- Hi-score ---
-    hi_score_surface = pygame.font.SysFont('Comic Sans MS', 20).render(
+    hi_score_surface = fonts.get_font('Comic Sans MS', 20).render(
         f'HI-SCORE: {hi_score}', True, (255, 255, 255))
     hi_score_surface.set_alpha(128)
     hi_score_x_pos = (screen.get_width() - hi_score_surface.get_width()) // 2
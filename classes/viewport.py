@@ -0,0 +1,134 @@
+"""Internal render resolution — the game world is drawn at a fraction of the window.
+
+Game logic, rects and collisions stay in world units (WIDTH x HEIGHT).  With
+a render scale below 1 the background and sprites are drawn to a smaller
+offscreen surface using pre-scaled image variants, and :meth:`Viewport.present`
+upscales that surface to the window once per frame; the HUD and menus are
+then drawn on the window at full resolution.  Fill-rate cost thus follows
+the render scale, not the window size.
+
+Sprites outside ``VIEW_RECT`` are not drawn at all, and only those inside
+``ACTIVE_BAND`` (the view plus ``ACTIVE_MARGIN``) are hit-tested.
+
+Pick the scale with ``RENDER_SCALE`` in constants.py, COSMIC_HEAT_RENDER_SCALE
+or ``python main.py --render-scale=0.5``.  Atlas sprites get their scaled
+variants when gameplay assets finish loading; every other image (bosses,
+backgrounds, rotation frames) is scaled the first time it is drawn and
+cached for as long as the original surface lives.
+"""
+import os
+import sys
+import weakref
+
+import pygame
+
+from .constants import WIDTH, HEIGHT, RENDER_SCALE, ACTIVE_MARGIN
+from .display import get_screen
+from . import atlas
+
+# The visible world, and the band around it where entities are "active":
+# outside it they only move (no drawing, no hit tests).
+VIEW_RECT = pygame.Rect(0, 0, WIDTH, HEIGHT)
+ACTIVE_BAND = VIEW_RECT.inflate(2 * ACTIVE_MARGIN, 2 * ACTIVE_MARGIN)
+
+
+def _configured_scale():
+    value = os.environ.get('COSMIC_HEAT_RENDER_SCALE')
+    for arg in sys.argv[1:]:
+        if arg.startswith('--render-scale='):
+            value = arg.split('=', 1)[1]
+    if value is None:
+        return RENDER_SCALE
+    try:
+        scale = float(value)
+    except ValueError:
+        scale = 0
+    if not 0 < scale <= 1:
+        print(f"Warning: ignoring render scale {value!r} (expected 0 < scale <= 1)")
+        return RENDER_SCALE
+    return scale
+
+
+def scale_image(image, scale):
+    """*image* resampled by *scale*, keeping its pixel format."""
+    w, h = image.get_size()
+    size = (max(1, round(w * scale)), max(1, round(h * scale)))
+    return pygame.transform.smoothscale(image, size)
+
+
+class Viewport:
+    """Render target for the game world at *scale* times the window size."""
+
+    def __init__(self, window, scale=1.0):
+        self.window = window
+        self.scale = scale
+        if scale == 1:
+            self.surface = window
+        else:
+            size = (round(WIDTH * scale), round(HEIGHT * scale))
+            self.surface = pygame.Surface(size).convert()
+        self._scaled = weakref.WeakKeyDictionary()   # world image -> scaled variant
+
+    def image(self, image):
+        """The render-scale variant of *image* (scaled on first use)."""
+        if self.scale == 1:
+            return image
+        scaled = self._scaled.get(image)
+        if scaled is None:
+            scaled = self._scaled[image] = scale_image(image, self.scale)
+            if image.get_flags() & (pygame.RLEACCEL | pygame.RLEACCELOK):   # OK until first blit
+                scaled.set_alpha(255, pygame.RLEACCEL)
+        return scaled
+
+    def nbytes(self):
+        """Pixel bytes of the render-scale variants made so far."""
+        return sum(s.get_pitch() * s.get_height() for s in self._scaled.values())
+
+    def source(self, image):
+        """(surface, area) to blit *image* from at render scale."""
+        return atlas.source(image) if self.scale == 1 else atlas.render_source(image, self.image)
+
+    def point(self, x, y):
+        """World position -> render position."""
+        s = self.scale
+        return round(x * s), round(y * s)
+
+    def rect(self, rect):
+        """World rect -> render rect."""
+        if self.scale == 1:
+            return rect
+        s = self.scale
+        x, y = round(rect[0] * s), round(rect[1] * s)
+        return pygame.Rect(x, y, round((rect[0] + rect[2]) * s) - x, round((rect[1] + rect[3]) * s) - y)
+
+    def present(self):
+        """Upscale the rendered world onto the window."""
+        if self.surface is not self.window:
+            pygame.transform.scale(self.surface, self.window.get_size(), self.window)
+
+
+# ---- singleton access ----
+
+_viewport = None
+_scale = None
+
+
+def get_viewport():
+    """Get the shared Viewport for the game window (display must be initialized)."""
+    global _viewport
+    if _viewport is None:
+        _viewport = Viewport(get_screen(), get_scale())
+    return _viewport
+
+
+def variant_bytes():
+    """Bytes held by the shared Viewport's render-scale variants (0 before it exists)."""
+    return _viewport.nbytes() if _viewport is not None else 0
+
+
+def get_scale():
+    """The configured render scale (usable before the display exists)."""
+    global _scale
+    if _scale is None:
+        _scale = _configured_scale()
+    return _scale
@@ -7,12 +7,18 @@ from classes import controls
 from classes.constants import WIDTH, HEIGHT, FPS, SHOOT_DELAY
 from classes.display import get_screen
 from classes import sound
+from classes import animation
+from classes import consumers
+from classes import framestats
+from classes import pools
+from classes import rotation
+from classes.viewport import get_viewport
 from classes.ui import show_game_over, music_background, draw_hud
-from classes.assets import get_assets
+from classes.assets import get_assets, SlotView
 from classes.player import Player
 from classes.bullets import Bullet
 from classes.groups import GameGroups, State
-from classes.spawner import spawn_tick
+from classes.spawner import SpawnScheduler, load_waves, spawn_bosses
 from classes.draw import BackgroundState, draw_background, draw_pause, draw_game_world
 from classes.collisions import (
     process_refills,
@@ -21,6 +27,8 @@ from classes.collisions import (
     process_enemy1,
     process_enemy2,
     process_boss,
+    process_boss_bullets,
+    swept_bounds,
 )
 
 
@@ -28,11 +36,17 @@ def main():
     """Run the core gameplay loop."""
     music_background()
     screen = get_screen()
+    view = get_viewport()   # world render target (may be below window resolution)
     clock = pygame.time.Clock()
     assets = get_assets()
 
     # --- state ---
     groups = GameGroups()
+    tally = consumers.Tally()
+    for consumer in (consumers.Effects(groups, assets), consumers.Drops(groups, assets),
+                     consumers.play_sounds, tally, framestats.count_events):
+        groups.events.subscribe(consumer)
+    spawns = SpawnScheduler(groups, load_waves())
     player = Player()
     score = 0
     hi_score = 0
@@ -42,7 +56,7 @@ def main():
     running = True
 
     # --- background ---
-    bg_imgs = [assets.backgrounds[k] for k in ('bg1', 'bg2', 'bg3', 'bg4')]
+    bg_imgs = SlotView(assets.backgrounds, ('bg1', 'bg2', 'bg3', 'bg4'))
     bg = BackgroundState.create(bg_imgs)
 
     # --- input ---
@@ -81,6 +95,7 @@ def main():
         if state == State.GAME_OVER:
             show_game_over(score)
             groups.empty_all()
+            spawns.reset()
             score = 0
             player_life = 200
             bullet_counter = 200
@@ -97,18 +112,28 @@ def main():
         now = pygame.time.get_ticks()
         if controls.action_holding("shoot") and bullet_counter > 0 and now - last_shot_time > SHOOT_DELAY:
             last_shot_time = now
-            groups.bullets.add(Bullet(player.rect.centerx, player.rect.top))
+            groups.bullets.add(Bullet(player.rect.centerx, player.rect.top, groups.world))
             bullet_counter -= 1
 
+        # --- asset tiers (prefetch / evict around score thresholds) ---
+        assets.update_tiers(score)
+
+        # --- difficulty tier (speeds, spawn chances, background, bosses) ---
+        difficulty = groups.difficulty
+        if difficulty.update(score):
+            spawns.set_tier(difficulty.tier)
+            spawn_bosses(groups, assets)
+
         # --- background ---
-        bg.update(score)
-        draw_background(screen, bg)
+        bg.update(difficulty.tier)
+        draw_background(view, bg)
 
         if score > hi_score:
             hi_score = score
 
-        # --- spawning ---
-        spawn_tick(score, groups, assets)
+        # --- spawning & lifetime (bounds, max age, population caps) ---
+        spawns.tick(assets)
+        groups.lifetime.enforce()
 
         # --- death check ---
         if player_life <= 0:
@@ -116,31 +141,34 @@ def main():
             continue
 
         # --- collisions ---
-        life_d, ammo_d, score_d = process_refills(groups, player, score)
-        player_life = min(200, player_life + life_d)
-        bullet_counter = min(200, bullet_counter + ammo_d)
-        score += score_d
-
-        player_life += process_black_holes(groups, player, score)
-
-        ld, sd = process_hazard_group(groups.meteors, groups, player, assets, score)
-        player_life += ld; score += sd
-
-        ld, sd = process_hazard_group(groups.meteors2, groups, player, assets, score)
-        player_life += ld; score += sd
+        groups.bullet_grid.build(groups.bullets, swept_bounds)
+        process_refills(groups, player)
+        process_black_holes(groups, player)
+        process_hazard_group(groups.meteors, groups, player)
+        process_hazard_group(groups.meteors2, groups, player)
+        process_enemy1(groups, player)
+        process_enemy2(groups, player)
+        for i in range(3):
+            process_boss(i, groups, player)
+        process_boss_bullets(groups, player)
 
-        ld, sd = process_enemy1(groups, player, assets)
-        player_life += ld; score += sd
+        # --- events: effects, drops, sounds, scoring ---
+        groups.events.flush()
+        player_life = min(200, player_life + tally.heal) - tally.damage
+        bullet_counter = min(200, bullet_counter + tally.ammo)
+        score += tally.score
+        tally.reset()
 
-        ld, sd = process_enemy2(groups, player, assets)
-        player_life += ld; score += sd
+        # --- ECS systems (movement, lifetime) ---
+        groups.world.step()
 
-        for i in range(3):
-            ld, sd = process_boss(i, groups, player, assets)
-            player_life += ld; score += sd
+        # --- animation (simulation clock; stands still while paused) ---
+        animation.clock.advance()
+        animation.step(groups.explosions, groups.explosions2)
 
         # --- render world ---
-        bullet_counter -= draw_game_world(screen, groups, player)
+        draw_game_world(view, groups, player)
+        view.present()
 
         # --- HUD ---
         draw_hud(screen, player_life, bullet_counter, score, hi_score,
@@ -148,7 +176,10 @@ def main():
                  assets.refills['extra_score'])
 
         pygame.display.flip()
+        pools.end_frame()
+        framestats.end_frame()
         clock.tick(FPS)
 
     sound.stop_music()
+    rotation.get_cache().save()
     pygame.quit()
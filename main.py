@@ -1,15 +1,28 @@
-"""Cosmic Heat — entry point. Initializes display, loads assets, launches menu."""
+"""Cosmic Heat — entry point. Initializes display, loads menu assets, launches menu.
+
+Gameplay assets keep loading in the background while the menu runs.
+Run with ``--trace-startup`` for a timed breakdown of startup.
+"""
 
 if __name__ == '__main__':
-    from classes import sound
-    from classes.display import init_display
-    from classes.assets import load_all_assets
+    from classes import profiler
+
+    with profiler.trace("import subsystems"):
+        from classes import sound
+        from classes import fonts
+        from classes.display import init_display
+        from classes.assets import load_menu_assets
+
+    with profiler.trace("display init"):
+        screen = init_display()
+    fonts.start_discovery()  # overlaps with audio init and asset loading
 
-    sound.init_audio()
-    screen = init_display()
-    sound.set_num_channels(20)
+    with profiler.trace("audio init"):
+        sound.init_audio()
+        sound.set_num_channels(20)
 
-    load_all_assets(screen)  # loading screen shown here
+    load_menu_assets(screen)  # menu stage only; the rest streams in
 
-    import menu
+    with profiler.trace("import menu"):
+        import menu
     menu.main()
@@ -7,6 +7,8 @@ from classes.constants import WIDTH, HEIGHT, BLACK, WHITE, RED
 from classes.display import get_screen
 from classes import controls
 from classes import sound
+from classes import fonts
+from classes import profiler
 from classes.assets import get_assets
 
 
@@ -21,21 +23,16 @@ def animate_screen():
         pygame.time.wait(10)
 
 
-# Use pre-loaded assets (loaded in main.py before this module is imported)
-_assets = get_assets()
-mainmenu_img = _assets.menu['background']
-logo_img = _assets.menu['logo']
-explosion_sound = _assets.sounds['menu_explosion']
+# Assets, music and the clock are set up by _setup() on the first main()
+# call, so importing this module has no side effects.  Menu-stage assets are
+# loaded in main.py; gameplay assets may still be streaming in (see start_game).
+_assets = None
+mainmenu_img = None
+logo_img = None
+explosion_sound = None
+clock = None
 
-screen = get_screen()
-
-sound.load_music('game_sounds/menu.mp3')
-sound.set_music_volume(0.25)
-sound.play_music(-1)
-
-clock = pygame.time.Clock()
-
-logo_x = (WIDTH - logo_img.get_width()) // 2
+logo_x = 0
 logo_y = 50
 
 play_button_rect = pygame.Rect(WIDTH // 2 - 100, HEIGHT // 2 - 25, 205, 50)
@@ -45,8 +42,33 @@ selected_button = 0
 show_menu = True
 
 
+def _setup():
+    """Fetch menu assets, start the menu music and create the clock."""
+    global _assets, mainmenu_img, logo_img, explosion_sound, clock, logo_x
+    _assets = get_assets()
+    mainmenu_img = _assets.menu['background']
+    logo_img = _assets.menu['logo']
+    explosion_sound = _assets.sounds['menu_explosion']
+    logo_x = (WIDTH - logo_img.get_width()) // 2
+
+    sound.load_music('game_sounds/menu.mp3')
+    sound.set_music_volume(0.25)
+    sound.play_music(-1)
+
+    clock = pygame.time.Clock()
+
+
+def start_game():
+    """Wait for any gameplay assets still loading, then run the game."""
+    _assets.wait_ready(get_screen())
+    import gameplay
+    gameplay.main()
+
+
 def main():
     global show_menu, selected_button
+    if clock is None:
+        _setup()
     show_menu = True
     screen = get_screen()
 
@@ -65,8 +87,7 @@ def main():
                     explosion_sound.play()
                     animate_screen()
                     show_menu = False
-                    import gameplay
-                    gameplay.main()
+                    start_game()
                     return
                 elif quit_button_rect.collidepoint(x, y):
                     pygame.quit()
@@ -83,8 +104,7 @@ def main():
                 animate_screen()
                 show_menu = False
                 screen.fill(BLACK)
-                import gameplay
-                gameplay.main()
+                start_game()
                 return
             elif selected_button == 1:
                 pygame.quit()
@@ -94,7 +114,7 @@ def main():
 
         screen.blit(logo_img, (logo_x, logo_y))
 
-        font = pygame.font.SysFont('Comic Sans MS', 40)
+        font = fonts.get_font('Comic Sans MS', 40)
         text = font.render("Play", True, WHITE)
         pygame.draw.rect(screen, BLACK, play_button_rect, border_radius=10)
         if selected_button == 0:
@@ -110,6 +130,8 @@ def main():
         text_rect.center = quit_button_rect.center
         screen.blit(text, text_rect)
         pygame.display.flip()
+        profiler.report()
+        _assets.pump()
         clock.tick(60)
 
 